@@ -8,7 +8,7 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Union, Optional
 from loguru import logger
 
-from parsers.data_loader import DataLoader
+from parsers.data_loader import DataLoader, get_loader
 
 
 class BaseAnalyzer(ABC):
@@ -19,9 +19,9 @@ class BaseAnalyzer(ABC):
         Initialize base analyzer.
         
         Args:
-            data_loader: DataLoader instance, creates new one if None
+            data_loader: DataLoader instance, uses the shared loader if None
         """
-        self.data_loader = data_loader if data_loader else DataLoader()
+        self.data_loader = data_loader if data_loader else get_loader()
         self._analysis_cache: Dict[str, Any] = {}
     
     def clear_cache(self) -> None:
@@ -1,45 +1,381 @@
 import streamlit as st
 import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
 import pandas as pd
+import numpy as np
 import sys
 import os
+import gzip
+import pickle
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from loguru import logger
 
 # Add the parent directory to the path so we can import from analysis
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from analysis.qa_analyzer import QAAnalyzer
-from parsers.data_loader import DataLoader
-from analysis.vehicle_state_analyzer import VehicleStateAnalyzer
+from parsers.data_loader import get_loader
+from analysis.vehicle_state_analyzer import VehicleStateAnalyzer, CACHE_VERSION
 from analysis.sensor_analyzer import SensorAnalyzer
 from analysis.predictor_analyzer import PredictorAnalyzer
 
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = "orjson"  # Faster figure serialization for st.plotly_chart
+except ImportError:  # orjson is optional; plotly falls back to the stdlib encoder
+    pass
+
+CACHE_DIR = Path("cache")
+MAX_BOX_POINTS = 5000  # Above this, box plots are drawn from precomputed quartiles
+
+
+def load_vehicle_analyses(vehicle_analyzer):
+    """
+    Load all-scene vehicle analyses from the disk cache, running the analyzer on a miss.
+    
+    The cache file is keyed on the data file's fingerprint and the analyzer's
+    CACHE_VERSION, so a new data file or changed analyzer code always
+    triggers a fresh analysis.
+    
+    Args:
+        vehicle_analyzer: VehicleStateAnalyzer instance
+        
+    Returns:
+        Result of VehicleStateAnalyzer.analyze_all_scenes()
+    """
+    source_key = vehicle_analyzer.data_loader.cache_fingerprint(CACHE_VERSION)
+    if source_key is None:
+        return vehicle_analyzer.analyze_all_scenes()
+    cache_path = CACHE_DIR / f"vehicle_analyses_{source_key}.pkl.gz"
+    
+    if cache_path.exists():
+        try:
+            return pickle.loads(gzip.decompress(cache_path.read_bytes()))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable analysis cache {cache_path}: {e}")
+    
+    analyses = vehicle_analyzer.analyze_all_scenes()
+    
+    # Write to a uniquely named temporary file first so readers never see a partial cache
+    tmp_name = None
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=CACHE_DIR, suffix='.tmp', delete=False) as tmp_file:
+            tmp_name = tmp_file.name
+            tmp_file.write(gzip.compress(pickle.dumps(analyses, protocol=pickle.HIGHEST_PROTOCOL)))
+        os.replace(tmp_name, cache_path)
+    except Exception as e:
+        logger.warning(f"Failed to write analysis cache {cache_path}: {e}")
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+    
+    return analyses
+
+
+def metric_column(records, key, default=0):
+    """
+    Extract one numeric field from a list of metric dictionaries as a float array.
+    
+    Args:
+        records: Metric dictionaries, one per chart row
+        key: Field to extract
+        default: Value used when a dictionary lacks the field
+        
+    Returns:
+        Array with one value per record
+    """
+    return np.fromiter((record.get(key, default) for record in records), dtype=np.float64, count=len(records))
+
+
+def nested_metric_frame(nested, field):
+    """
+    Flatten a two-level metric mapping into one matrix in a single pass.
+    
+    Args:
+        nested: Mapping of column label to a mapping of row label to metric dictionary
+        field: Metric to extract from each inner dictionary
+        
+    Returns:
+        DataFrame with sorted row and column labels, NaN where a pair is missing
+    """
+    frame = pd.DataFrame({
+        column: {row: metrics[field] for row, metrics in rows.items()}
+        for column, rows in nested.items()
+    })
+    return frame.sort_index().sort_index(axis=1)
+
+
+def build_vehicle_tables(all_scenes_data):
+    """
+    Build the velocity and driving style tables from the vehicle analyses in one pass.
+    
+    Args:
+        all_scenes_data: Per-scene vehicle analyses keyed by scene name
+        
+    Returns:
+        Tuple of (velocity DataFrame, driving style DataFrame), each None if no
+        scene has that metric
+    """
+    velocity_data = {}
+    style_data = {}
+    for scene_name, scene_data in all_scenes_data.items():
+        if not scene_data:
+            continue
+        if 'velocity_summary' in scene_data:
+            velocity_data[scene_name] = scene_data['velocity_summary']
+        if 'driving_style' in scene_data:
+            style_data[scene_name] = scene_data['driving_style']
+    
+    vel_df = None
+    if velocity_data:
+        vel_summaries = list(velocity_data.values())
+        vel_df = pd.DataFrame({
+            'Scene': list(velocity_data),
+            'Avg Speed (m/s)': metric_column(vel_summaries, 'avg_speed'),
+            'Max Speed (m/s)': metric_column(vel_summaries, 'max_speed'),
+            'Avg Acceleration (m/s²)': metric_column(vel_summaries, 'avg_acceleration'),
+            'Total Distance (m)': metric_column(vel_summaries, 'total_distance'),
+            'Total Duration (s)': metric_column(vel_summaries, 'total_duration')
+        })
+    
+    style_df = None
+    if style_data:
+        styles = list(style_data.values())
+        style_df = pd.DataFrame({
+            'Scene': list(style_data),
+            'Style': pd.Categorical([style.get('style', 'unknown') for style in styles]),
+            'Score': metric_column(styles, 'overall_score'),
+            'Speed Score': metric_column(styles, 'speed_score'),
+            'Acceleration Score': metric_column(styles, 'acceleration_score'),
+            'Curvature Score': metric_column(styles, 'curvature_score')
+        })
+    
+    return vel_df, style_df
+
+
+def build_vehicle_figures(vel_df, style_df):
+    """
+    Build the vehicle section's charts from its tables.
+    
+    Args:
+        vel_df: Velocity DataFrame from build_vehicle_tables, or None
+        style_df: Driving style DataFrame from build_vehicle_tables, or None
+        
+    Returns:
+        Dictionary of chart name to plotly figure, without the charts whose table is None
+    """
+    figures = {}
+    if vel_df is not None:
+        figures['speed'] = px.bar(vel_df, x='Scene', y=['Avg Speed (m/s)', 'Max Speed (m/s)'], barmode='group')
+        figures['distance'] = px.bar(vel_df, x='Scene', y='Total Distance (m)')
+    if style_df is not None:
+        figures['style'] = px.bar(style_df, x='Scene', y='Score', color='Style')
+        figures['components'] = px.bar(
+            style_df,
+            x='Scene',
+            y=['Speed Score', 'Acceleration Score', 'Curvature Score'],
+            barmode='group'
+        )
+    return figures
+
+
+@st.cache_resource(show_spinner=False)
+def qa_distribution_figure(counts, qa_types, total):
+    """
+    Build the QA distribution bar chart, memoized on its inputs.
+    
+    A single bar trace renders far lighter than a pie.
+    
+    Args:
+        counts: Tuple of question counts, one per QA type
+        qa_types: Tuple of QA type names matching counts
+        total: Total number of questions, used for the share labels
+        
+    Returns:
+        Plotly bar figure
+    """
+    values = np.fromiter(counts, dtype=np.int64, count=len(counts))
+    shares = values / max(total, 1)
+    fig = go.Figure(go.Bar(
+        x=[qa_type.capitalize() for qa_type in qa_types],
+        y=values,
+        text=[f"{share:.1%}" for share in shares],
+        marker_color=['#ff9999', '#66b3ff', '#99ff99', '#ffcc99']
+    ))
+    fig.update_layout(title="QA Distribution Across All Scenes", xaxis_title="QA Type", yaxis_title="Questions")
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def initialize_analyzers():
+    """
+    Create the data loader and analyzers once per server process.
+    
+    Cached as a resource (never hashed or copied) so the parsed data and each
+    analyzer's internal result caches survive Streamlit reruns and sessions.
+    
+    Returns:
+        Tuple of (data_loader, qa_analyzer, vehicle_analyzer, sensor_analyzer, predictor_analyzer)
+    """
+    data_loader = get_loader()
+    return (
+        data_loader,
+        QAAnalyzer(data_loader),
+        VehicleStateAnalyzer(data_loader),
+        SensorAnalyzer(data_loader),
+        PredictorAnalyzer(data_loader)
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_executor():
+    """
+    Create the worker pool for the section analyses once per server process.
+    
+    Shared across reruns and sessions so fast reruns reuse the same bounded
+    set of workers instead of each starting a new pool.
+    
+    Returns:
+        ThreadPoolExecutor instance
+    """
+    return ThreadPoolExecutor(max_workers=5)
+
+
+def summary_box_figure(values_by_group):
+    """
+    Build a box plot from per-group quartiles computed server-side.
+    
+    Only five statistics per group are sent to the browser instead of every
+    raw value. Whiskers follow plotly's default 1.5 IQR rule clipped to the data.
+    
+    Args:
+        values_by_group: Mapping of group label to a 1-D array of values
+        
+    Returns:
+        Plotly figure with one precomputed box per non-empty group
+    """
+    fig = go.Figure()
+    for label, values in values_by_group.items():
+        if values.size == 0:
+            continue
+        q1, median, q3 = np.percentile(values, [25, 50, 75])
+        iqr = q3 - q1
+        fig.add_trace(go.Box(
+            x=[label],
+            q1=[q1],
+            median=[median],
+            q3=[q3],
+            lowerfence=[values[values >= q1 - 1.5 * iqr].min()],
+            upperfence=[values[values <= q3 + 1.5 * iqr].max()],
+            name=label,
+            showlegend=False
+        ))
+    return fig
+
+
+def heatmap_figure(df, labels, title=None):
+    """
+    Build a heatmap straight from a DataFrame's values.
+    
+    Bypasses plotly express' per-call type and axis inference: the matrix goes
+    in as one float array with the index and columns as axis labels.
+    
+    Args:
+        df: DataFrame whose rows map to the y axis and columns to the x axis
+        labels: Dictionary with 'x', 'y' and 'color' axis titles
+        title: Optional figure title
+        
+    Returns:
+        Plotly heatmap figure
+    """
+    fig = go.Figure(go.Heatmap(
+        z=df.to_numpy(dtype=np.float64),
+        x=df.columns.astype(str),
+        y=df.index.astype(str),
+        colorbar=dict(title=labels['color'])
+    ))
+    fig.update_layout(title=title, xaxis_title=labels['x'], yaxis_title=labels['y'])
+    fig.update_yaxes(autorange='reversed')  # First row on top, as with px.imshow
+    return fig
+
+
+@st.fragment
+def show_predictor_analysis(predictor_analyzer):
+    """
+    Render the predictor analysis section.
+    
+    Runs as a fragment, so toggling its checkbox reruns only this section
+    instead of the whole dashboard. The analysis is the slowest on the page
+    and only runs once the user asks for it.
+    
+    Args:
+        predictor_analyzer: PredictorAnalyzer instance
+    """
+    st.header("Predictor Analysis")
+    
+    if not st.checkbox("Run predictor analysis", key='run_predictors'):
+        st.info("Tick the box above to analyze which data fields predict each QA type.")
+        return
+    
+    # Get predictor analysis data
+    predictor_results = predictor_analyzer.analyze_qa_type_predictors()
+    
+    st.subheader("Feature Importance by QA Type")
+    
+    # Feature x QA type matrix of the top 10 features per type
+    importance_pivot = nested_metric_frame({
+        qa_type.capitalize(): {
+            feature_info['feature']: feature_info
+            for feature_info in results['feature_importance'][:10]
+        }
+        for qa_type, results in predictor_results.items()
+        if 'feature_importance' in results
+    }, 'combined_score')
+    
+    if not importance_pivot.empty:
+        # Feature importance heatmap
+        fig_feature_importance = heatmap_figure(
+            importance_pivot,
+            labels=dict(x="QA Type", y="Feature", color="Importance Score"),
+            title="Feature Importance by QA Type"
+        )
+        st.plotly_chart(fig_feature_importance, use_container_width=True)
+
+
 def main():
     st.title(" Data Analysis Dashboard")
     
     # Initialize components
-    data_loader = DataLoader()
-    qa_analyzer = QAAnalyzer(data_loader)
-    vehicle_analyzer = VehicleStateAnalyzer(data_loader)
-    sensor_analyzer = SensorAnalyzer(data_loader)
-    predictor_analyzer = PredictorAnalyzer(data_loader)
+    data_loader, qa_analyzer, vehicle_analyzer, sensor_analyzer, predictor_analyzer = initialize_analyzers()
+    
+    # The section analyses are independent, so start them all concurrently
+    # and only wait on each one where its section renders
+    executor = get_executor()
+    futures = {
+        'qa_totals': executor.submit(qa_analyzer.analyze_scenes),
+        'qa_content': executor.submit(qa_analyzer.analyze_qa_content),
+        'sensor_coverage': executor.submit(sensor_analyzer.analyze_sensor_coverage),
+        'sensor_usage': executor.submit(sensor_analyzer.analyze_scene_specific_usage)
+    }
+    # The vehicle tables live in session state under the data/code fingerprint, so reruns
+    # skip loading the analyses until the data file or analyzer code changes
+    vehicle_key = data_loader.cache_fingerprint(CACHE_VERSION)
+    vehicle_cached = 'vehicle_tables' in st.session_state and st.session_state.get('vehicle_key') == vehicle_key
+    if not vehicle_cached:
+        futures['vehicle'] = executor.submit(load_vehicle_analyses, vehicle_analyzer)
     
     # Get QA distribution data
-    totals = qa_analyzer.analyze_scenes()  # This gets data for all scenes
+    totals = futures['qa_totals'].result()  # This gets data for all scenes
     
     # Extract totals
     total = totals["total"]
     
-    # Create pie chart data
-    qa_types = ['perception', 'planning', 'prediction', 'behavior']
-    values = [totals[qa_type] for qa_type in qa_types]
-    
-    # Create pie chart
-    fig = px.pie(
-        values=values,
-        names=[qa_type.capitalize() for qa_type in qa_types],
-        title="QA Distribution Across All Scenes",
-        color_discrete_sequence=['#ff9999', '#66b3ff', '#99ff99', '#ffcc99']
-    )
+    # Create bar chart, reused across reruns while the counts are unchanged
+    qa_types = ('perception', 'planning', 'prediction', 'behavior')
+    fig = qa_distribution_figure(tuple(totals[qa_type] for qa_type in qa_types), qa_types, total)
     
     # Display the chart
     st.plotly_chart(fig, use_container_width=True)
@@ -48,7 +384,7 @@ def main():
     st.header("QA Content Analysis")
     
     # Get content analysis data
-    qa_content = qa_analyzer.analyze_qa_content()
+    qa_content = futures['qa_content'].result()
     
     # Create tabs for QA analysis
     qa_tab1, qa_tab2, qa_tab3 = st.tabs(["Object Mentions", "Question-Answer Patterns", "Answer Characteristics"])
@@ -60,7 +396,7 @@ def main():
         # Create bar chart for object mentions
         objects_df = pd.DataFrame({
             'Objects': list(object_data.keys()),
-            'Mention Count': list(object_data.values())
+            'Mention Count': np.fromiter(object_data.values(), dtype=np.int64, count=len(object_data))
         })
         fig_objects = px.bar(
             objects_df,
@@ -77,16 +413,16 @@ def main():
         
         # Create grouped bar chart for object mentions by QA type
         # Prepare data for grouped bar chart
-        chart_data = []
-        for qa_type, objects in objects_by_type.items():
-            for obj, count in objects.items():
-                chart_data.append({
-                    'QA Type': qa_type.capitalize(),
-                    'Object': obj,
-                    'Count': count
-                })
-        
-        df_objects_by_type = pd.DataFrame(chart_data)
+        type_sizes = [len(objects) for objects in objects_by_type.values()]
+        df_objects_by_type = pd.DataFrame({
+            'QA Type': np.repeat([qa_type.capitalize() for qa_type in objects_by_type], type_sizes),
+            'Object': [obj for objects in objects_by_type.values() for obj in objects],
+            'Count': np.fromiter(
+                (count for objects in objects_by_type.values() for count in objects.values()),
+                dtype=np.int64,
+                count=sum(type_sizes)
+            )
+        })
         
         # Create grouped bar chart
         fig_objects_by_type = px.bar(
@@ -105,7 +441,7 @@ def main():
         
         # Create heatmap for question patterns
         pattern_df = pd.DataFrame(question_patterns).T
-        fig_patterns = px.imshow(
+        fig_patterns = heatmap_figure(
             pattern_df,
             labels=dict(x="QA Type", y="Pattern", color="Count")
         )
@@ -116,7 +452,7 @@ def main():
         
         # Create heatmap for answer patterns
         answer_pattern_df = pd.DataFrame(answer_patterns).T
-        fig_answer_patterns = px.imshow(
+        fig_answer_patterns = heatmap_figure(
             answer_pattern_df,
             labels=dict(x="QA Type", y="Pattern", color="Count")
         )
@@ -127,31 +463,45 @@ def main():
         answer_chars = qa_content['answer_characteristics']
         
         # Create box plot for answer lengths
-        length_data = []
-        for qa_type, lengths in answer_chars['lengths'].items():
-            for length in lengths:
-                length_data.append({'QA Type': qa_type.capitalize(), 'Answer Length': length})
-        
-        length_df = pd.DataFrame(length_data)
-        fig_lengths = px.box(
-            length_df, 
-            x='QA Type', 
-            y='Answer Length'
-        )
+        lengths_by_type = answer_chars['lengths']
+        length_arrays = [np.asarray(lengths, dtype=np.float64) for lengths in lengths_by_type.values()]
+        if sum(lengths.size for lengths in length_arrays) > MAX_BOX_POINTS:
+            fig_lengths = summary_box_figure({
+                qa_type.capitalize(): lengths for qa_type, lengths in zip(lengths_by_type, length_arrays)
+            })
+            fig_lengths.update_layout(xaxis_title='QA Type', yaxis_title='Answer Length')
+        else:
+            length_df = pd.DataFrame({
+                'QA Type': np.repeat([qa_type.capitalize() for qa_type in lengths_by_type],
+                                     [len(lengths) for lengths in length_arrays]),
+                'Answer Length': np.concatenate(length_arrays) if length_arrays else np.empty(0)
+            })
+            fig_lengths = px.box(
+                length_df, 
+                x='QA Type', 
+                y='Answer Length'
+            )
         st.plotly_chart(fig_lengths, use_container_width=True)
     
     # Vehicle State Analysis Section
     st.header("Vehicle State Analysis")
     
-    # Get vehicle state analysis data for all scenes
-    all_scenes_data = {}
-    for scene_id in range(1, 7):
+    # Derive the per-scene tables and their charts once per session and fingerprint; reruns reuse them
+    if vehicle_cached:
+        vel_df, style_df = st.session_state['vehicle_tables']
+        vehicle_figures = st.session_state['vehicle_figures']
+    else:
         try:
-            scene_analysis = vehicle_analyzer.analyze_scene(scene_id)
-            all_scenes_data[f"Scene {scene_id}"] = scene_analysis
+            all_scenes_data = futures['vehicle'].result()['scene_analyses']
+            vel_df, style_df = build_vehicle_tables(all_scenes_data)
+            vehicle_figures = build_vehicle_figures(vel_df, style_df)
+            st.session_state['vehicle_figures'] = vehicle_figures
+            st.session_state['vehicle_tables'] = (vel_df, style_df)
+            st.session_state['vehicle_key'] = vehicle_key
         except Exception as e:
-            st.error(f"Error analyzing Scene {scene_id}: {e}")
-            continue
+            st.error(f"Error analyzing scenes: {e}")
+            vel_df, style_df = None, None
+            vehicle_figures = {}
     
     # Create tabs for vehicle analysis
     vehicle_tab1, vehicle_tab2 = st.tabs(["Velocity Summary", "Driving Style"])
@@ -159,88 +509,33 @@ def main():
     with vehicle_tab1:
         st.subheader("Velocity Summary")
         
-        # Prepare velocity data
-        velocity_data = []
-        for scene_name, scene_data in all_scenes_data.items():
-            if scene_data and 'velocity_summary' in scene_data:
-                vel_summary = scene_data['velocity_summary']
-                velocity_data.append({
-                    'Scene': scene_name,
-                    'Avg Speed (m/s)': vel_summary.get('avg_speed', 0),
-                    'Max Speed (m/s)': vel_summary.get('max_speed', 0),
-                    'Avg Acceleration (m/s²)': vel_summary.get('avg_acceleration', 0),
-                    'Total Distance (m)': vel_summary.get('total_distance', 0),
-                    'Total Duration (s)': vel_summary.get('total_duration', 0)
-                })
-        
-        if velocity_data:
-            vel_df = pd.DataFrame(velocity_data)
-            
+        if vel_df is not None:
             # Speed comparison
-            fig_speed = px.bar(
-                vel_df,
-                x='Scene',
-                y=['Avg Speed (m/s)', 'Max Speed (m/s)'],
-                barmode='group'
-            )
-            st.plotly_chart(fig_speed, use_container_width=True)
+            st.plotly_chart(vehicle_figures['speed'], use_container_width=True)
             
             # Distance and duration
-            fig_distance = px.bar(
-                vel_df,
-                x='Scene',
-                y='Total Distance (m)'
-            )
-            st.plotly_chart(fig_distance, use_container_width=True)
+            st.plotly_chart(vehicle_figures['distance'], use_container_width=True)
             
             # Show detailed metrics table
             st.subheader("Detailed Velocity Metrics")
-            st.dataframe(vel_df.set_index('Scene'))
+            st.table(vel_df.set_index('Scene'))
     
     with vehicle_tab2:
         st.subheader("Driving Style Analysis")
         
-        # Prepare driving style data
-        style_data = []
-        for scene_name, scene_data in all_scenes_data.items():
-            if scene_data and 'driving_style' in scene_data:
-                style = scene_data['driving_style']
-                style_data.append({
-                    'Scene': scene_name,
-                    'Style': style.get('style', 'unknown'),
-                    'Score': style.get('overall_score', 0),
-                    'Speed Score': style.get('speed_score', 0),
-                    'Acceleration Score': style.get('acceleration_score', 0),
-                    'Curvature Score': style.get('curvature_score', 0)
-                })
-        
-        if style_data:
-            style_df = pd.DataFrame(style_data)
-            
+        if style_df is not None:
             # Driving style distribution
-            fig_style = px.bar(
-                style_df,
-                x='Scene',
-                y='Score',
-                color='Style'
-            )
-            st.plotly_chart(fig_style, use_container_width=True)
+            st.plotly_chart(vehicle_figures['style'], use_container_width=True)
             
             # Style component breakdown
-            fig_components = px.bar(
-                style_df,
-                x='Scene',
-                y=['Speed Score', 'Acceleration Score', 'Curvature Score'],
-                barmode='group'
-            )
-            st.plotly_chart(fig_components, use_container_width=True)
+            st.plotly_chart(vehicle_figures['components'], use_container_width=True)
     
     # Sensor Analysis Section
     st.header("Sensor Analysis")
     
     # Get sensor analysis data
-    sensor_coverage = sensor_analyzer.analyze_sensor_coverage()
-    sensor_usage = sensor_analyzer.analyze_scene_specific_usage()
+    sensor_coverage = futures['sensor_coverage'].result()
+    sensor_usage = futures['sensor_usage'].result()
     
     # Create tabs for sensor analysis
     sensor_tab1, sensor_tab2 = st.tabs(["Sensor Coverage", "Scene-Specific Usage"])
@@ -248,23 +543,12 @@ def main():
     with sensor_tab1:
         st.subheader("Camera Activity Patterns")
         
-        # Prepare camera activity data
-        camera_activity_data = []
-        for scene_name, camera_data in sensor_coverage['camera_activity'].items():
-            for camera, data in camera_data.items():
-                camera_activity_data.append({
-                    'Scene': scene_name,
-                    'Camera': camera,
-                    'Activity (%)': data['percentage'],
-                    'Is Active': data['is_active']
-                })
+        # Camera x scene activity matrix
+        camera_pivot = nested_metric_frame(sensor_coverage['camera_activity'], 'percentage')
         
-        if camera_activity_data:
-            camera_df = pd.DataFrame(camera_activity_data)
-            
+        if not camera_pivot.empty:
             # Camera activity heatmap
-            camera_pivot = camera_df.pivot(index='Camera', columns='Scene', values='Activity (%)')
-            fig_camera_activity = px.imshow(
+            fig_camera_activity = heatmap_figure(
                 camera_pivot,
                 labels=dict(x="Scene", y="Camera", color="Activity (%)"),
                 title="Camera Activity by Scene"
@@ -274,17 +558,16 @@ def main():
         st.subheader("Sensor Fusion Patterns")
         
         # Prepare fusion data
-        fusion_data = []
-        for scene_name, fusion_data_scene in sensor_coverage['sensor_fusion_patterns'].items():
-            fusion_data.append({
-                'Scene': scene_name,
-                'Camera-Radar Fusion (%)': fusion_data_scene.get('camera_radar_fusion_pct', 0),
-                'Camera-LiDAR Fusion (%)': fusion_data_scene.get('camera_lidar_fusion_pct', 0),
-                'Full Sensor Fusion (%)': fusion_data_scene.get('full_sensor_fusion_pct', 0)
-            })
+        fusion_data = sensor_coverage['sensor_fusion_patterns']
         
         if fusion_data:
-            fusion_df = pd.DataFrame(fusion_data)
+            fusion_patterns = list(fusion_data.values())
+            fusion_df = pd.DataFrame({
+                'Scene': list(fusion_data),
+                'Camera-Radar Fusion (%)': metric_column(fusion_patterns, 'camera_radar_fusion_pct'),
+                'Camera-LiDAR Fusion (%)': metric_column(fusion_patterns, 'camera_lidar_fusion_pct'),
+                'Full Sensor Fusion (%)': metric_column(fusion_patterns, 'full_sensor_fusion_pct')
+            })
             
             # Fusion patterns bar chart
             fig_fusion = px.bar(
@@ -298,23 +581,12 @@ def main():
     with sensor_tab2:
         st.subheader("Camera Importance by Scene")
         
-        # Prepare camera importance data
-        importance_data = []
-        for scene_name, importance_data_scene in sensor_usage['camera_importance'].items():
-            for camera, data in importance_data_scene.items():
-                importance_data.append({
-                    'Scene': scene_name,
-                    'Camera': camera,
-                    'Importance Score': data['importance_score'],
-                    'Importance Level': data['importance_level']
-                })
+        # Camera x scene importance matrix
+        importance_pivot = nested_metric_frame(sensor_usage['camera_importance'], 'importance_score')
         
-        if importance_data:
-            importance_df = pd.DataFrame(importance_data)
-            
+        if not importance_pivot.empty:
             # Camera importance heatmap
-            importance_pivot = importance_df.pivot(index='Camera', columns='Scene', values='Importance Score')
-            fig_importance = px.imshow(
+            fig_importance = heatmap_figure(
                 importance_pivot,
                 labels=dict(x="Scene", y="Camera", color="Importance Score"),
                 title="Camera Importance by Scene"
@@ -324,15 +596,13 @@ def main():
         st.subheader("Sensor Redundancy Analysis")
         
         # Prepare redundancy data
-        redundancy_data = []
-        for scene_name, redundancy_data_scene in sensor_usage['sensor_redundancy'].items():
-            redundancy_data.append({
-                'Scene': scene_name,
-                'Overall Redundancy': redundancy_data_scene.get('overall_redundancy', 0)
-            })
+        redundancy_data = sensor_usage['sensor_redundancy']
         
         if redundancy_data:
-            redundancy_df = pd.DataFrame(redundancy_data)
+            redundancy_df = pd.DataFrame({
+                'Scene': list(redundancy_data),
+                'Overall Redundancy': metric_column(list(redundancy_data.values()), 'overall_redundancy')
+            })
             
             # Redundancy bar chart
             fig_redundancy = px.bar(
@@ -343,36 +613,7 @@ def main():
             st.plotly_chart(fig_redundancy, use_container_width=True)
     
     # Predictor Analysis Section
-    st.header("Predictor Analysis")
-    
-    # Get predictor analysis data
-    predictor_results = predictor_analyzer.analyze_qa_type_predictors()
-    
-    st.subheader("Feature Importance by QA Type")
-    
-    # Prepare feature importance data
-    importance_data = []
-    for qa_type, results in predictor_results.items():
-        if 'feature_importance' in results:
-            for i, feature_info in enumerate(results['feature_importance'][:10]):  # Top 10 features
-                importance_data.append({
-                    'QA Type': qa_type.capitalize(),
-                    'Feature': feature_info['feature'],
-                    'Combined Score': feature_info['combined_score'],
-                    'Rank': i + 1
-                })
-    
-    if importance_data:
-        importance_df = pd.DataFrame(importance_data)
-        
-        # Feature importance heatmap
-        importance_pivot = importance_df.pivot(index='Feature', columns='QA Type', values='Combined Score')
-        fig_feature_importance = px.imshow(
-            importance_pivot,
-            labels=dict(x="QA Type", y="Feature", color="Importance Score"),
-            title="Feature Importance by QA Type"
-        )
-        st.plotly_chart(fig_feature_importance, use_container_width=True)
+    show_predictor_analysis(predictor_analyzer)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
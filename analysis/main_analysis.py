@@ -7,7 +7,7 @@ Runs all analysis components and generates deliverables.
 from typing import Dict, Any
 from loguru import logger
 
-from parsers.data_loader import DataLoader
+from parsers.data_loader import get_loader
 from .vehicle_state_analyzer import VehicleStateAnalyzer
 from .dashboard_generator import DashboardGenerator
 
@@ -22,7 +22,7 @@ class MainAnalysis:
         Args:
             data_path: Path to the concatenated data file
         """
-        self.data_loader = DataLoader(data_path)
+        self.data_loader = get_loader(data_path)
         self.vehicle_analyzer = VehicleStateAnalyzer(self.data_loader)
         self.dashboard_generator = DashboardGenerator(self.data_loader)
     
@@ -9,7 +9,7 @@ Analyzes question-answer pairs across different levels:
 
 from collections import Counter, defaultdict
 import re
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from loguru import logger
 
@@ -109,15 +109,15 @@ class QAAnalyzer(BaseAnalyzer):
         if result is None:
             logger.info("Analyzing QA content patterns...")
             
-            # Get all QA data efficiently
-            all_qa_data = self._extract_all_qa_data()
+            # Get all QA pairs as columns, extracted once for every pass
+            qa_records = self._build_qa_records()
             
             # Analyze content patterns
-            object_mentions = self._extract_all_object_mentions(all_qa_data)
-            object_mentions_by_type = self._extract_object_mentions_by_qa_type(all_qa_data)
-            question_patterns = self._analyze_question_patterns(all_qa_data)
-            answer_patterns = self._analyze_answer_patterns(all_qa_data)
-            answer_characteristics = self._analyze_answer_characteristics(all_qa_data)
+            object_mentions = self._extract_all_object_mentions(qa_records)
+            object_mentions_by_type = self._extract_object_mentions_by_qa_type(qa_records)
+            question_patterns = self._analyze_question_patterns(qa_records)
+            answer_patterns = self._analyze_answer_patterns(qa_records)
+            answer_characteristics = self._analyze_answer_characteristics(qa_records)
             
             result = {
                 'objects': object_mentions,
@@ -158,6 +158,32 @@ class QAAnalyzer(BaseAnalyzer):
         
         return result
     
+    def _build_qa_records(self) -> Dict[str, List[str]]:
+        """
+        Build all QA pairs as parallel columns.
+        
+        Each pair's QA type and lowercased question and answer are extracted once,
+        in scene and keyframe order, so the content passes scan flat lists instead
+        of re-walking and re-lowercasing the nested QA dictionaries. Not cached:
+        the only caller caches its own result.
+        
+        Returns:
+            Dictionary with equal-length 'qa_type', 'question' and 'answer' lists
+        """
+        qa_type_column = []
+        question_column = []
+        answer_column = []
+        
+        for qa_data in self._extract_all_qa_data().values():
+            for qa_type in self.qa_types:
+                if qa_type in qa_data:
+                    for qa_pair in qa_data[qa_type]:
+                        qa_type_column.append(qa_type)
+                        question_column.append(qa_pair.get('Q', '').lower())
+                        answer_column.append(qa_pair.get('A', '').lower())
+        
+        return {'qa_type': qa_type_column, 'question': question_column, 'answer': answer_column}
+    
     def _get_qa_distribution_from_scene_data(self, scene_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Get QA distribution from scene data.
@@ -180,6 +206,32 @@ class QAAnalyzer(BaseAnalyzer):
         
         return qa_distribution
     
+    def _get_qa_distribution(self, scene_id: Union[int, str], keyframe_id: Optional[Union[int, str]]) -> Dict[str, Any]:
+        """
+        Get QA distribution for a keyframe, or for the whole scene when keyframe_id is None, with caching.
+        
+        Args:
+            scene_id: Scene identifier (int or str)
+            keyframe_id: Keyframe identifier (int or str), None for all keyframes
+            
+        Returns:
+            Dictionary with QA type distribution
+        """
+        cache_key = f"qa_distribution_{scene_id}_{keyframe_id}"
+        result = self.get_cached_result(cache_key)
+        
+        if result is None:
+            scene_data = self.get_scene_data(scene_id)
+            if keyframe_id is None:
+                result = self._get_qa_distribution_from_scene_data(scene_data)
+            else:
+                keyframe_token = self.data_loader._assign_keyframe_token(scene_id, keyframe_id)
+                keyframe_data = scene_data['key_frames'][keyframe_token]
+                result = self._get_qa_distribution_from_scene_data({'key_frames': {keyframe_token: keyframe_data}})
+            self.set_cached_result(cache_key, result)
+        
+        return result
+    
     def _extract_object_mentions(self, qa_data: Dict[str, List[Dict]]) -> Dict[str, int]:
         """Extract object mentions from QA data"""
         object_mentions = defaultdict(int)
@@ -356,7 +408,7 @@ class QAAnalyzer(BaseAnalyzer):
     #     logger.info(f"All keyframe analysis: {all_keyframe_analysis}")
     #     # scene_analysis = {
     #     #     'total_keyframes': len(scene_data['key_frames']),
-    #     #     'qa_type_distribution': self._get_qa_distribution(scene_id, 0),
+    #     #     'qa_type_distribution': self._get_qa_distribution(scene_id, None),
     #     #     # 'object_mentions_total': all_keyframe_analysis['object_mentions'],
     #     #     # risk_indicators of this scene
     #     #     'risk_indicators': self._extract_risk_indicators(qa_data),
@@ -369,8 +421,8 @@ class QAAnalyzer(BaseAnalyzer):
     #     # }
     #     return all_keyframe_analysis
 
-    def _extract_all_object_mentions(self, all_qa_data: Dict[str, Any]) -> Dict[str, int]:
-        """Extract object mentions from all QA data"""
+    def _extract_all_object_mentions(self, qa_records: Dict[str, List[str]]) -> Dict[str, int]:
+        """Extract object mentions from all QA records"""
         object_mentions = Counter()
         
         # Common object patterns
@@ -388,21 +440,15 @@ class QAAnalyzer(BaseAnalyzer):
             r'\b(construction|construction vehicle)\b'
         ]
         
-        for scene_keyframe, qa_data in all_qa_data.items():
-            for qa_type in self.qa_types:
-                if qa_type in qa_data:
-                    for qa_pair in qa_data[qa_type]:
-                        question = qa_pair.get('Q', '').lower()
-                        answer = qa_pair.get('A', '').lower()
-                        
-                        for pattern in object_patterns:
-                            matches = re.findall(pattern, question + ' ' + answer)
-                            for match in matches:
-                                object_mentions[match] += 1
+        for question, answer in zip(qa_records['question'], qa_records['answer']):
+            text = question + ' ' + answer
+            for pattern in object_patterns:
+                for match in re.findall(pattern, text):
+                    object_mentions[match] += 1
         
         return dict(object_mentions.most_common(15))  # Top 15 objects
     
-    def _extract_object_mentions_by_qa_type(self, all_qa_data: Dict[str, Any]) -> Dict[str, Dict[str, int]]:
+    def _extract_object_mentions_by_qa_type(self, qa_records: Dict[str, List[str]]) -> Dict[str, Dict[str, int]]:
         """Extract object mentions broken down by QA type"""
         object_mentions_by_type = {qa_type: Counter() for qa_type in self.qa_types}
         
@@ -421,17 +467,12 @@ class QAAnalyzer(BaseAnalyzer):
             r'\b(construction|construction vehicle)\b'
         ]
         
-        for scene_keyframe, qa_data in all_qa_data.items():
-            for qa_type in self.qa_types:
-                if qa_type in qa_data:
-                    for qa_pair in qa_data[qa_type]:
-                        question = qa_pair.get('Q', '').lower()
-                        answer = qa_pair.get('A', '').lower()
-                        
-                        for pattern in object_patterns:
-                            matches = re.findall(pattern, question + ' ' + answer)
-                            for match in matches:
-                                object_mentions_by_type[qa_type][match] += 1
+        for qa_type, question, answer in zip(qa_records['qa_type'], qa_records['question'], qa_records['answer']):
+            text = question + ' ' + answer
+            type_mentions = object_mentions_by_type[qa_type]
+            for pattern in object_patterns:
+                for match in re.findall(pattern, text):
+                    type_mentions[match] += 1
         
         # Convert to regular dict and get top objects
         result = {}
@@ -440,7 +481,7 @@ class QAAnalyzer(BaseAnalyzer):
         
         return result
     
-    def _analyze_question_patterns(self, all_qa_data: Dict[str, Any]) -> Dict[str, Dict[str, int]]:
+    def _analyze_question_patterns(self, qa_records: Dict[str, List[str]]) -> Dict[str, Dict[str, int]]:
         """Analyze question patterns by QA type"""
         question_patterns = defaultdict(lambda: defaultdict(int))
         
@@ -455,21 +496,16 @@ class QAAnalyzer(BaseAnalyzer):
             'action': ['should', 'will', 'going to', 'planning to']
         }
         
-        for scene_keyframe, qa_data in all_qa_data.items():
-            for qa_type in self.qa_types:
-                if qa_type in qa_data:
-                    for qa_pair in qa_data[qa_type]:
-                        question = qa_pair.get('Q', '').lower()
-                        
-                        for pattern_name, keywords in question_patterns_keywords.items():
-                            for keyword in keywords:
-                                if keyword in question:
-                                    question_patterns[pattern_name][qa_type] += 1
-                                    break
+        for qa_type, question in zip(qa_records['qa_type'], qa_records['question']):
+            for pattern_name, keywords in question_patterns_keywords.items():
+                for keyword in keywords:
+                    if keyword in question:
+                        question_patterns[pattern_name][qa_type] += 1
+                        break
         
         return dict(question_patterns)
     
-    def _analyze_answer_patterns(self, all_qa_data: Dict[str, Any]) -> Dict[str, Dict[str, int]]:
+    def _analyze_answer_patterns(self, qa_records: Dict[str, List[str]]) -> Dict[str, Dict[str, int]]:
         """Analyze answer patterns by QA type"""
         answer_patterns = defaultdict(lambda: defaultdict(int))
         
@@ -484,38 +520,28 @@ class QAAnalyzer(BaseAnalyzer):
             'qualitative': ['good', 'bad', 'safe', 'dangerous', 'clear', 'obstructed']
         }
         
-        for scene_keyframe, qa_data in all_qa_data.items():
-            for qa_type in self.qa_types:
-                if qa_type in qa_data:
-                    for qa_pair in qa_data[qa_type]:
-                        answer = qa_pair.get('A', '').lower()
-                        
-                        for pattern_name, keywords in answer_patterns_keywords.items():
-                            for keyword in keywords:
-                                if keyword in answer:
-                                    answer_patterns[pattern_name][qa_type] += 1
-                                    break
+        for qa_type, answer in zip(qa_records['qa_type'], qa_records['answer']):
+            for pattern_name, keywords in answer_patterns_keywords.items():
+                for keyword in keywords:
+                    if keyword in answer:
+                        answer_patterns[pattern_name][qa_type] += 1
+                        break
         
         return dict(answer_patterns)
     
-    def _analyze_answer_characteristics(self, all_qa_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_answer_characteristics(self, qa_records: Dict[str, List[str]]) -> Dict[str, Any]:
         """Analyze answer characteristics by QA type"""
         answer_lengths = defaultdict(list)
         answer_complexity = defaultdict(list)
         
-        for scene_keyframe, qa_data in all_qa_data.items():
-            for qa_type in self.qa_types:
-                if qa_type in qa_data:
-                    for qa_pair in qa_data[qa_type]:
-                        answer = qa_pair.get('A', '').lower()
-                        
-                        # Answer length (word count)
-                        word_count = len(answer.split())
-                        answer_lengths[qa_type].append(word_count)
-                        
-                        # Answer complexity (sentence count)
-                        sentence_count = len([s for s in answer.split('.') if s.strip()])
-                        answer_complexity[qa_type].append(sentence_count)
+        for qa_type, answer in zip(qa_records['qa_type'], qa_records['answer']):
+            # Answer length (word count)
+            word_count = len(answer.split())
+            answer_lengths[qa_type].append(word_count)
+            
+            # Answer complexity (sentence count)
+            sentence_count = len([s for s in answer.split('.') if s.strip()])
+            answer_complexity[qa_type].append(sentence_count)
         
         return {
             'lengths': dict(answer_lengths),
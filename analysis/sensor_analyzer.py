@@ -7,7 +7,7 @@ Analyzes camera and sensor data patterns across scenes:
 - Multi-modal sensor fusion patterns
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from collections import defaultdict
 from loguru import logger
 
@@ -24,14 +24,19 @@ class SensorAnalyzer:
         self.radars = ['RADAR_FRONT', 'RADAR_FRONT_LEFT', 'RADAR_FRONT_RIGHT', 'RADAR_BACK_LEFT', 'RADAR_BACK_RIGHT']
         self.lidars = ['LIDAR_TOP']
         self.all_sensors = self.cameras + self.radars + self.lidars
+        self._coverage_cache: Optional[Dict[str, Any]] = None
+        self._scene_usage_cache: Optional[Dict[str, Any]] = None
     
     def analyze_sensor_coverage(self) -> Dict[str, Any]:
         """
-        Analyze sensor coverage patterns across all scenes.
+        Analyze sensor coverage patterns across all scenes with caching.
         
         Returns:
             Dictionary containing sensor coverage analysis
         """
+        if self._coverage_cache is not None:
+            return self._coverage_cache
+        
         logger.info("Analyzing sensor coverage patterns...")
         
         coverage_data = {
@@ -62,15 +67,19 @@ class SensorAnalyzer:
             fusion_patterns = self._analyze_sensor_fusion(scene_data)
             coverage_data['sensor_fusion_patterns'][scene_name] = fusion_patterns
         
+        self._coverage_cache = coverage_data
         return coverage_data
     
     def analyze_scene_specific_usage(self) -> Dict[str, Any]:
         """
-        Analyze scene-specific sensor usage patterns.
+        Analyze scene-specific sensor usage patterns with caching.
         
         Returns:
             Dictionary containing scene-specific sensor analysis
         """
+        if self._scene_usage_cache is not None:
+            return self._scene_usage_cache
+        
         logger.info("Analyzing scene-specific sensor usage...")
         
         scene_usage_data = {
@@ -96,6 +105,7 @@ class SensorAnalyzer:
             critical_sensors = self._identify_critical_sensors(scene_data)
             scene_usage_data['critical_sensors'][scene_name] = critical_sensors
         
+        self._scene_usage_cache = scene_usage_data
         return scene_usage_data
     
     def _analyze_camera_activity(self, scene_data: Dict[str, Any]) -> Dict[str, Any]:
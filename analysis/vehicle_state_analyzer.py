@@ -4,57 +4,406 @@ Vehicle State Analyzer
 Analyzes ego vehicle movement and state data for driving behavior insights.
 """
 
-from typing import Dict, Any, Union
+import hashlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Tuple, Union
 import numpy as np
 from loguru import logger
 
+from parsers import constants as parser_constants, data_loader as data_loader_module
 from parsers.data_loader import DataLoader
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels then run as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Hash of the code and scene/keyframe token tables that derive the scene analyses;
+# part of on-disk cache keys so results written by older code are never loaded
+CACHE_VERSION = hashlib.md5(
+    b"".join(Path(source).read_bytes() for source in (__file__, data_loader_module.__file__, parser_constants.__file__)),
+    usedforsecurity=False
+).hexdigest()[:8]
+
+
+@njit(cache=True, nogil=True)
+def _scan_movement(speeds, accelerations, timestamps, angular_velocities, speed_limit, accel_limit):
+    """
+    Single pass over a scene's movement arrays.
+    
+    Args:
+        speeds: Per-sample speeds (N,)
+        accelerations: Per-sample acceleration vectors (N, 3)
+        timestamps: Per-sample timestamps in microseconds (N,)
+        angular_velocities: Per-sample angular velocities (N,)
+        speed_limit: Speed above which a sample counts as a violation
+        accel_limit: Acceleration magnitude above which a sample counts as a violation
+        
+    Returns:
+        Tuple of (max_speed, max_acceleration, avg_jerk, max_jerk,
+        avg_angular_acceleration, max_angular_acceleration, moving_samples,
+        accelerating_samples, speed_violations, acceleration_violations)
+    """
+    n = speeds.shape[0]
+    max_speed = 0.0
+    max_accel = 0.0
+    moving_samples = 0
+    accelerating_samples = 0
+    speed_violations = 0
+    accel_violations = 0
+    jerk_sum = 0.0
+    jerk_count = 0
+    max_jerk = 0.0
+    angular_sum = 0.0
+    angular_count = 0
+    max_angular = 0.0
+    
+    for i in range(n):
+        speed = speeds[i]
+        if speed > 0:
+            moving_samples += 1
+            if speed > max_speed:
+                max_speed = speed
+            if speed > speed_limit:
+                speed_violations += 1
+        
+        ax = accelerations[i, 0]
+        ay = accelerations[i, 1]
+        az = accelerations[i, 2]
+        if ax != 0 or ay != 0 or az != 0:
+            accel = np.sqrt(ax * ax + ay * ay + az * az)
+            accelerating_samples += 1
+            if accel > max_accel:
+                max_accel = accel
+            if accel > accel_limit:
+                accel_violations += 1
+        
+        # Jerk and angular acceleration start from the third sample, where
+        # acceleration is first defined
+        if i >= 2:
+            dt = (timestamps[i] - timestamps[i - 1]) / 1e6
+            angular = 0.0
+            if dt > 0:
+                dx = ax - accelerations[i - 1, 0]
+                dy = ay - accelerations[i - 1, 1]
+                dz = az - accelerations[i - 1, 2]
+                jerk = np.sqrt(dx * dx + dy * dy + dz * dz) / dt
+                jerk_sum += jerk
+                jerk_count += 1
+                if jerk > max_jerk:
+                    max_jerk = jerk
+                angular = abs(angular_velocities[i] - angular_velocities[i - 1]) / dt
+            angular_sum += angular
+            angular_count += 1
+            if angular > max_angular:
+                max_angular = angular
+    
+    avg_jerk = jerk_sum / jerk_count if jerk_count > 0 else 0.0
+    avg_angular = angular_sum / angular_count if angular_count > 0 else 0.0
+    return (max_speed, max_accel, avg_jerk, max_jerk, avg_angular, max_angular,
+            moving_samples, accelerating_samples, speed_violations, accel_violations)
+
+
+@njit(cache=True, nogil=True)
+def _basic_stats(values):
+    """
+    Mean, min, max and standard deviation of a 1-D array in a single pass.
+    
+    Uses Welford's online algorithm for the mean and variance, tracking
+    min and max inline.
+    
+    Args:
+        values: Input values (N,)
+        
+    Returns:
+        Tuple of (mean, min, max, std), all 0.0 for an empty array
+    """
+    n = values.shape[0]
+    if n == 0:
+        return 0.0, 0.0, 0.0, 0.0
+    
+    mean = 0.0
+    m2 = 0.0
+    min_value = values[0]
+    max_value = values[0]
+    for i in range(n):
+        value = values[i]
+        delta = value - mean
+        mean += delta / (i + 1)
+        m2 += delta * (value - mean)
+        if value < min_value:
+            min_value = value
+        if value > max_value:
+            max_value = value
+    
+    return mean, min_value, max_value, np.sqrt(m2 / n)
+
+
+@njit(cache=True, nogil=True)
+def _scan_distances(distances, close_distance, high_risk_distance, risk_range):
+    """
+    Single pass over a scene's ego-to-object distances for the proximity metrics.
+    
+    Collision risk falls linearly from 1 at zero distance to 0 at risk_range.
+    Means use the same Welford update as _basic_stats.
+    
+    Args:
+        distances: Ego-to-object distances (M,)
+        close_distance: Distance below which an interaction counts as close
+        high_risk_distance: Distance below which an interaction counts as high risk
+        risk_range: Distance at which collision risk reaches zero
+        
+    Returns:
+        Tuple of (close_interactions, high_risk_interactions, avg_distance,
+        min_distance, avg_collision_risk, max_collision_risk, high_risk_objects)
+    """
+    n = distances.shape[0]
+    close_interactions = 0
+    high_risk_interactions = 0
+    high_risk_objects = 0
+    if n == 0:
+        return 0, 0, 0.0, 0.0, 0.0, 0.0, 0
+    
+    avg_distance = 0.0
+    min_distance = distances[0]
+    avg_risk = 0.0
+    max_risk = 0.0
+    for i in range(n):
+        distance = distances[i]
+        if distance < close_distance:
+            close_interactions += 1
+        if distance < high_risk_distance:
+            high_risk_interactions += 1
+        avg_distance += (distance - avg_distance) / (i + 1)
+        if distance < min_distance:
+            min_distance = distance
+        
+        risk = 1 - (distance / risk_range)
+        if risk < 0.0:
+            risk = 0.0
+        avg_risk += (risk - avg_risk) / (i + 1)
+        if i == 0 or risk > max_risk:
+            max_risk = risk
+        if risk > 0.5:
+            high_risk_objects += 1
+
+    return (close_interactions, high_risk_interactions, avg_distance, min_distance,
+            avg_risk, max_risk, high_risk_objects)
+
 
 class VehicleStateAnalyzer:
     """Vehicle state analyzer for driving behavior insights"""
 
+    # Traffic rule thresholds (example values)
+    _SPEED_LIMIT = 8.0  # m/s (about 29 km/h)
+    _ACCEL_LIMIT = 3.0  # m/s²
+    
+    # Driving style classification thresholds
+    _SPEED_THRESH = 5.0  # m/s
+    _ACCEL_THRESH = 2.0  # m/s²
+    _CURVATURE_THRESH = 0.015
+    
+    # Object proximity thresholds
+    _CLOSE_DISTANCE = 5.0  # m
+    _HIGH_RISK_DISTANCE = 2.0  # m
+    _COLLISION_RISK_RANGE = 10.0  # m
+    
+    _EXPECTED_SENSORS = frozenset({'CAM_FRONT', 'LIDAR_TOP'})
+    _MAX_WORKERS = 4
+
     def __init__(self, data_loader: DataLoader):
         """Initialize the vehicle state analyzer"""
         self.data_loader = data_loader
+        self._movement_arrays_cache: Dict[Union[int, str], Dict[str, Any]] = {}
+        self._scene_stats_cache: Dict[Union[int, str], Dict[str, Any]] = {}
+        self._object_distances_cache: Dict[Union[int, str], np.ndarray] = {}
+        self._scene_metrics_cache: Dict[Union[int, str], Dict[str, Dict[str, Any]]] = {}
 
-    def get_velocity_summary(self, scene_id: Union[int, str]) -> Dict[str, Any]:
+    def _get_movement_arrays(self, scene_id: Union[int, str]) -> Dict[str, Any]:
         """
-        Get basic vehicle state information summary.
+        Get ego movement data as struct-of-arrays with caching.
         
         Args:
             scene_id: Scene identifier
             
         Returns:
-            Dictionary containing velocity and basic state summary
+            Dictionary of per-sample numpy arrays plus the movement summary stats,
+            or an empty dictionary if no movement data is available
         """
-        try:
-            movement_data = self.data_loader.extract_ego_movement_data(scene_id)
-            if not movement_data:
-                return {}
+        if scene_id in self._movement_arrays_cache:
+            return self._movement_arrays_cache[scene_id]
+        
+        movement_data = self.data_loader.extract_ego_movement_data(scene_id)
+        if not movement_data:
+            return {}
+        
+        entries = movement_data['movement_data']
+        count = len(entries)
+        accelerations = np.array([entry['acceleration'] for entry in entries], dtype=np.float64).reshape(-1, 3)
+        
+        arrays = {
+            'timestamp': np.fromiter((entry['timestamp'] for entry in entries), dtype=np.int64, count=count),
+            'speed': np.fromiter((entry['speed'] for entry in entries), dtype=np.float64, count=count),
+            'acceleration': accelerations,
+            # Row-wise magnitudes in one contiguous reduction instead of a norm call per entry
+            'acceleration_magnitude': np.sqrt(np.einsum('ij,ij->i', accelerations, accelerations)),
+            'acceleration_mask': np.any(accelerations != 0, axis=1),
+            'angular_velocity': np.fromiter((entry['angular_velocity'] for entry in entries), dtype=np.float64, count=count),
+            'curvature': np.fromiter((entry['curvature'] for entry in entries), dtype=np.float64, count=count),
+            'summary_stats': movement_data['summary_stats']
+        }
+        self._movement_arrays_cache[scene_id] = arrays
+        return arrays
+
+    def _scene_stats(self, scene_id: Union[int, str]) -> Dict[str, Any]:
+        """
+        Get aggregate movement statistics from a single fused scan with caching.
+        
+        Args:
+            scene_id: Scene identifier
             
-            # Extract velocity-related metrics
-            speeds = [entry['speed'] for entry in movement_data['movement_data'] if entry['speed'] > 0]
-            accelerations = [np.linalg.norm(entry['acceleration']) for entry in movement_data['movement_data'] if any(entry['acceleration'])]
+        Returns:
+            Dictionary of aggregate movement statistics, or an empty dictionary
+            if no movement data is available
+        """
+        if scene_id in self._scene_stats_cache:
+            return self._scene_stats_cache[scene_id]
+        
+        movement = self._get_movement_arrays(scene_id)
+        if not movement:
+            return {}
+        
+        (max_speed, max_accel, avg_jerk, max_jerk, avg_angular, max_angular,
+         moving_samples, accelerating_samples, speed_violations, accel_violations) = _scan_movement(
+            movement['speed'],
+            movement['acceleration'],
+            movement['timestamp'],
+            movement['angular_velocity'],
+            self._SPEED_LIMIT,
+            self._ACCEL_LIMIT
+        )
+        
+        stats = {
+            'max_speed': float(max_speed),
+            'max_acceleration': float(max_accel),
+            'avg_jerk': float(avg_jerk),
+            'max_jerk': float(max_jerk),
+            'avg_angular_acceleration': float(avg_angular),
+            'max_angular_acceleration': float(max_angular),
+            'moving_samples': int(moving_samples),
+            'accelerating_samples': int(accelerating_samples),
+            'speed_violations': int(speed_violations),
+            'acceleration_violations': int(accel_violations)
+        }
+        self._scene_stats_cache[scene_id] = stats
+        return stats
+
+    def _get_object_distances(self, scene_id: Union[int, str]) -> np.ndarray:
+        """
+        Get ego-to-object distances for every annotation in a scene with caching.
+        
+        All annotations are stacked into one (M, 3) matrix alongside an index back
+        to their sample's ego position, so the distances come from a single
+        vectorized norm instead of a nested sample/annotation loop.
+        
+        Args:
+            scene_id: Scene identifier
             
-            return {
-                'avg_speed': np.mean(speeds) if speeds else 0.0,
-                'max_speed': np.max(speeds) if speeds else 0.0,
-                'min_speed': np.min(speeds) if speeds else 0.0,
-                'speed_std': np.std(speeds) if speeds else 0.0,
-                'avg_acceleration': np.mean(accelerations) if accelerations else 0.0,
-                'max_acceleration': np.max(accelerations) if accelerations else 0.0,
-                'total_distance': movement_data['summary_stats']['total_distance'],
-                'total_duration': movement_data['summary_stats']['total_duration'],
-                'movement_segments': {
-                    'turning': len(movement_data['summary_stats']['turning_segments']),
-                    'straight': len(movement_data['summary_stats']['straight_segments']),
-                    'stopping': len(movement_data['summary_stats']['stopping_periods'])
-                }
+        Returns:
+            Array of shape (M,) with one distance per annotation
+        """
+        if scene_id in self._object_distances_cache:
+            return self._object_distances_cache[scene_id]
+        
+        scene_data = self.data_loader.load_scene_data(scene_id)
+        samples = list(scene_data['samples'].values())
+        
+        ego_positions = np.array([sample_data['ego_pose']['translation'] for sample_data in samples], dtype=np.float64).reshape(len(samples), 3)
+        annotation_pairs = [
+            (i, annotation['translation'])
+            for i, sample_data in enumerate(samples)
+            for annotation in sample_data.get('annotations', [])
+        ]
+        
+        if annotation_pairs:
+            sample_index = np.fromiter((i for i, _ in annotation_pairs), dtype=np.intp, count=len(annotation_pairs))
+            obj_positions = np.array([translation for _, translation in annotation_pairs], dtype=np.float64)
+            distances = np.linalg.norm(obj_positions - ego_positions[sample_index], axis=1)
+        else:
+            distances = np.empty(0)
+        
+        self._object_distances_cache[scene_id] = distances
+        return distances
+
+    def _compute_all_metrics(self, scene_id: Union[int, str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Compute all nine metric dictionaries for a scene from shared intermediates with caching.
+        
+        Movement arrays, their masked views and basic statistics are built once and
+        shared by the movement-based metrics; the scene samples and ego-to-object
+        distances are loaded once and shared by the proximity and system metrics.
+        
+        Args:
+            scene_id: Scene identifier
+            
+        Returns:
+            Dictionary mapping metric name to its analysis dictionary
+        """
+        if scene_id in self._scene_metrics_cache:
+            return self._scene_metrics_cache[scene_id]
+        
+        movement = self._get_movement_arrays(scene_id)
+        if movement:
+            profile = {
+                'speed_stats': _basic_stats(movement['speed'][movement['speed'] > 0]),
+                'acceleration_stats': _basic_stats(movement['acceleration_magnitude'][movement['acceleration_mask']]),
+                'curvature_stats': _basic_stats(movement['curvature'][movement['curvature'] > 0]),
+                'scene_stats': self._scene_stats(scene_id)
             }
+        else:
+            profile = {}
+        
+        samples = self.data_loader.load_scene_data(scene_id)['samples']
+        
+        # Malformed poses only empty the proximity metrics; system_performance still reports them
+        try:
+            proximity = _scan_distances(self._get_object_distances(scene_id), self._CLOSE_DISTANCE,
+                                        self._HIGH_RISK_DISTANCE, self._COLLISION_RISK_RANGE)
         except Exception as e:
-            logger.error(f"Error getting velocity summary: {e}")
-            return {}
+            logger.error(f"Error computing object distances for scene {scene_id}: {e}")
+            proximity = None
+        
+        metrics = {
+            'velocity_summary': self._velocity_summary(movement, profile) if movement else {},
+            'driving_style': self._driving_style(profile) if movement else {},
+            'smoothness': self._smoothness(profile['scene_stats']) if movement else {},
+            'predictability': self._predictability(profile) if movement else {},
+            'risk_assessment': self._risk_score(profile['scene_stats']) if movement else {},
+            'safety_margins': self._safety_margins(proximity) if proximity is not None else {},
+            'collision_risk': self._collision_risk(proximity) if proximity is not None else {},
+            'traffic_compliance': self._traffic_compliance(profile['scene_stats']) if movement else {},
+            'system_performance': self._system_performance(samples)
+        }
+        self._scene_metrics_cache[scene_id] = metrics
+        return metrics
+
+    def get_velocity_summary(self, scene_id: Union[int, str]) -> Dict[str, Any]:
+        """
+        Get basic vehicle state information summary.
+        
+        Args:
+            scene_id: Scene identifier
+            
+        Returns:
+            Dictionary containing velocity and basic state summary
+        """
+        return self._compute_all_metrics(scene_id)['velocity_summary']
 
     def classify_driving_style(self, scene_id: Union[int, str]) -> Dict[str, Any]:
         """
@@ -66,59 +415,7 @@ class VehicleStateAnalyzer:
         Returns:
             Dictionary containing driving style classification
         """
-        try:
-            movement_data = self.data_loader.extract_ego_movement_data(scene_id)
-            if not movement_data:
-                return {}
-            
-            speeds = [entry['speed'] for entry in movement_data['movement_data'] if entry['speed'] > 0]
-            accelerations = [np.linalg.norm(entry['acceleration']) for entry in movement_data['movement_data'] if any(entry['acceleration'])]
-            curvatures = [entry['curvature'] for entry in movement_data['movement_data'] if entry['curvature'] > 0]
-            
-            # Calculate style indicators
-            avg_speed = np.mean(speeds) if speeds else 0.0
-            max_speed = np.max(speeds) if speeds else 0.0
-            avg_accel = np.mean(accelerations) if accelerations else 0.0
-            max_accel = np.max(accelerations) if accelerations else 0.0
-            avg_curvature = np.mean(curvatures) if curvatures else 0.0
-            
-            # Define thresholds for classification
-            speed_threshold = 5.0  # m/s
-            accel_threshold = 2.0  # m/s²
-            curvature_threshold = 0.015
-            
-            # Calculate style score (0 = conservative, 1 = aggressive)
-            speed_score = min(avg_speed / speed_threshold, 1.0)
-            accel_score = min(avg_accel / accel_threshold, 1.0)
-            curvature_score = min(avg_curvature / curvature_threshold, 1.0)
-            
-            overall_score = (speed_score + accel_score + curvature_score) / 3
-            
-            # Classify style
-            if overall_score < 0.3:
-                style = "conservative"
-            elif overall_score < 0.7:
-                style = "moderate"
-            else:
-                style = "aggressive"
-            
-            return {
-                'style': style,
-                'overall_score': overall_score,
-                'speed_score': speed_score,
-                'acceleration_score': accel_score,
-                'curvature_score': curvature_score,
-                'metrics': {
-                    'avg_speed': avg_speed,
-                    'max_speed': max_speed,
-                    'avg_acceleration': avg_accel,
-                    'max_acceleration': max_accel,
-                    'avg_curvature': avg_curvature
-                }
-            }
-        except Exception as e:
-            logger.error(f"Error classifying driving style: {e}")
-            return {}
+        return self._compute_all_metrics(scene_id)['driving_style']
 
     def analyze_smoothness(self, scene_id: Union[int, str]) -> Dict[str, Any]:
         """
@@ -130,54 +427,7 @@ class VehicleStateAnalyzer:
         Returns:
             Dictionary containing smoothness analysis
         """
-        try:
-            movement_data = self.data_loader.extract_ego_movement_data(scene_id)
-            if not movement_data:
-                return {}
-            
-            # Calculate jerk (rate of change of acceleration)
-            jerks = []
-            angular_accelerations = []
-            
-            for i in range(2, len(movement_data['movement_data'])):
-                curr_accel = np.array(movement_data['movement_data'][i]['acceleration'])
-                prev_accel = np.array(movement_data['movement_data'][i-1]['acceleration'])
-                
-                # Time difference in seconds
-                dt = (movement_data['movement_data'][i]['timestamp'] - movement_data['movement_data'][i-1]['timestamp']) / 1e6
-                
-                if dt > 0:
-                    jerk = np.linalg.norm(curr_accel - prev_accel) / dt
-                    jerks.append(jerk)
-                
-                # Angular acceleration
-                curr_angular_vel = movement_data['movement_data'][i]['angular_velocity']
-                prev_angular_vel = movement_data['movement_data'][i-1]['angular_velocity']
-                angular_accel = abs(curr_angular_vel - prev_angular_vel) / dt if dt > 0 else 0
-                angular_accelerations.append(angular_accel)
-            
-            # Calculate smoothness metrics
-            avg_jerk = np.mean(jerks) if jerks else 0.0
-            max_jerk = np.max(jerks) if jerks else 0.0
-            avg_angular_accel = np.mean(angular_accelerations) if angular_accelerations else 0.0
-            max_angular_accel = np.max(angular_accelerations) if angular_accelerations else 0.0
-            
-            # Smoothness score (lower is smoother)
-            jerk_score = min(avg_jerk / 5.0, 1.0)  # Normalize to 0-1
-            angular_score = min(avg_angular_accel / 2.0, 1.0)
-            smoothness_score = 1.0 - (jerk_score + angular_score) / 2
-            
-            return {
-                'smoothness_score': smoothness_score,
-                'avg_jerk': avg_jerk,
-                'max_jerk': max_jerk,
-                'avg_angular_acceleration': avg_angular_accel,
-                'max_angular_acceleration': max_angular_accel,
-                'smoothness_level': 'smooth' if smoothness_score > 0.7 else 'moderate' if smoothness_score > 0.4 else 'rough'
-            }
-        except Exception as e:
-            logger.error(f"Error analyzing smoothness: {e}")
-            return {}
+        return self._compute_all_metrics(scene_id)['smoothness']
 
     def analyze_predictability(self, scene_id: Union[int, str]) -> Dict[str, Any]:
         """
@@ -189,38 +439,7 @@ class VehicleStateAnalyzer:
         Returns:
             Dictionary containing predictability analysis
         """
-        try:
-            movement_data = self.data_loader.extract_ego_movement_data(scene_id)
-            if not movement_data:
-                return {}
-            
-            speeds = [entry['speed'] for entry in movement_data['movement_data'] if entry['speed'] > 0]
-            accelerations = [np.linalg.norm(entry['acceleration']) for entry in movement_data['movement_data'] if any(entry['acceleration'])]
-            curvatures = [entry['curvature'] for entry in movement_data['movement_data'] if entry['curvature'] > 0]
-            
-            # Calculate consistency metrics
-            speed_std = np.std(speeds) if speeds else 0.0
-            accel_std = np.std(accelerations) if accelerations else 0.0
-            curvature_std = np.std(curvatures) if curvatures else 0.0
-            
-            # Normalize standard deviations
-            speed_consistency = max(0, 1 - (speed_std / 3.0))  # Lower std = higher consistency
-            accel_consistency = max(0, 1 - (accel_std / 2.0))
-            curvature_consistency = max(0, 1 - (curvature_std / 0.01))
-            
-            # Overall predictability score
-            predictability_score = (speed_consistency + accel_consistency + curvature_consistency) / 3
-            
-            return {
-                'predictability_score': predictability_score,
-                'speed_consistency': speed_consistency,
-                'acceleration_consistency': accel_consistency,
-                'curvature_consistency': curvature_consistency,
-                'predictability_level': 'predictable' if predictability_score > 0.7 else 'moderate' if predictability_score > 0.4 else 'unpredictable'
-            }
-        except Exception as e:
-            logger.error(f"Error analyzing predictability: {e}")
-            return {}
+        return self._compute_all_metrics(scene_id)['predictability']
 
     def calculate_risk_score(self, scene_id: Union[int, str]) -> Dict[str, Any]:
         """
@@ -232,50 +451,7 @@ class VehicleStateAnalyzer:
         Returns:
             Dictionary containing risk assessment
         """
-        try:
-            movement_data = self.data_loader.extract_ego_movement_data(scene_id)
-            if not movement_data:
-                return {}
-            
-            speeds = [entry['speed'] for entry in movement_data['movement_data'] if entry['speed'] > 0]
-            accelerations = [np.linalg.norm(entry['acceleration']) for entry in movement_data['movement_data'] if any(entry['acceleration'])]
-            jerks = []
-            
-            # Calculate jerk for risk assessment
-            for i in range(2, len(movement_data['movement_data'])):
-                curr_accel = np.array(movement_data['movement_data'][i]['acceleration'])
-                prev_accel = np.array(movement_data['movement_data'][i-1]['acceleration'])
-                dt = (movement_data['movement_data'][i]['timestamp'] - movement_data['movement_data'][i-1]['timestamp']) / 1e6
-                if dt > 0:
-                    jerk = np.linalg.norm(curr_accel - prev_accel) / dt
-                    jerks.append(jerk)
-            
-            # Risk factors
-            max_speed = np.max(speeds) if speeds else 0.0
-            max_accel = np.max(accelerations) if accelerations else 0.0
-            max_jerk = np.max(jerks) if jerks else 0.0
-            
-            # Risk thresholds
-            speed_risk = min(max_speed / 10.0, 1.0)  # 10 m/s threshold
-            accel_risk = min(max_accel / 5.0, 1.0)   # 5 m/s² threshold
-            jerk_risk = min(max_jerk / 10.0, 1.0)    # 10 m/s³ threshold
-            
-            # Overall risk score
-            risk_score = (speed_risk + accel_risk + jerk_risk) / 3
-            
-            return {
-                'risk_score': risk_score,
-                'speed_risk': speed_risk,
-                'acceleration_risk': accel_risk,
-                'jerk_risk': jerk_risk,
-                'risk_level': 'low' if risk_score < 0.3 else 'medium' if risk_score < 0.7 else 'high',
-                'max_speed': max_speed,
-                'max_acceleration': max_accel,
-                'max_jerk': max_jerk
-            }
-        except Exception as e:
-            logger.error(f"Error calculating risk score: {e}")
-            return {}
+        return self._compute_all_metrics(scene_id)['risk_assessment']
 
     def analyze_safety_margins(self, scene_id: Union[int, str]) -> Dict[str, Any]:
         """
@@ -287,53 +463,7 @@ class VehicleStateAnalyzer:
         Returns:
             Dictionary containing safety margin analysis
         """
-        try:
-            scene_data = self.data_loader.load_scene_data(scene_id)
-            samples = scene_data['samples']
-            
-            safety_margins = []
-            object_interactions = []
-            
-            for sample_token, sample_data in samples.items():
-                ego_pose = sample_data['ego_pose']
-                ego_position = np.array(ego_pose['translation'])
-                
-                # Calculate distances to all objects
-                for annotation in sample_data.get('annotations', []):
-                    obj_position = np.array(annotation['translation'])
-                    distance = np.linalg.norm(ego_position - obj_position)
-                    
-                    safety_margins.append({
-                        'timestamp': ego_pose['timestamp'],
-                        'object_category': annotation['category'],
-                        'distance': distance,
-                        'object_size': annotation['size']
-                    })
-                    
-                    # Identify close interactions
-                    if distance < 5.0:  # 5 meters threshold
-                        object_interactions.append({
-                            'timestamp': ego_pose['timestamp'],
-                            'object_category': annotation['category'],
-                            'distance': distance,
-                            'risk_level': 'high' if distance < 2.0 else 'medium' if distance < 3.0 else 'low'
-                        })
-            
-            # Calculate safety metrics
-            distances = [item['distance'] for item in safety_margins]
-            avg_distance = np.mean(distances) if distances else 0.0
-            min_distance = np.min(distances) if distances else 0.0
-            
-            return {
-                'avg_safety_margin': avg_distance,
-                'min_safety_margin': min_distance,
-                'close_interactions': len(object_interactions),
-                'high_risk_interactions': len([i for i in object_interactions if i['risk_level'] == 'high']),
-                'safety_score': max(0, 1 - (len(object_interactions) / 10))  # Fewer interactions = higher safety
-            }
-        except Exception as e:
-            logger.error(f"Error analyzing safety margins: {e}")
-            return {}
+        return self._compute_all_metrics(scene_id)['safety_margins']
 
     def assess_collision_risk(self, scene_id: Union[int, str]) -> Dict[str, Any]:
         """
@@ -345,45 +475,7 @@ class VehicleStateAnalyzer:
         Returns:
             Dictionary containing collision risk assessment
         """
-        try:
-            scene_data = self.data_loader.load_scene_data(scene_id)
-            samples = scene_data['samples']
-            
-            collision_risks = []
-            
-            for sample_token, sample_data in samples.items():
-                ego_pose = sample_data['ego_pose']
-                ego_position = np.array(ego_pose['translation'])
-                # ego_velocity = np.array([0, 0, 0])  # Would need to calculate from movement data
-                
-                for annotation in sample_data.get('annotations', []):
-                    obj_position = np.array(annotation['translation'])
-                    distance = np.linalg.norm(ego_position - obj_position)
-                    
-                    # Simple collision risk based on distance and relative velocity
-                    # In a real implementation, you'd calculate relative velocity
-                    collision_risk = max(0, 1 - (distance / 10.0))  # Risk decreases with distance
-                    
-                    collision_risks.append({
-                        'timestamp': ego_pose['timestamp'],
-                        'object_category': annotation['category'],
-                        'distance': distance,
-                        'collision_risk': collision_risk
-                    })
-            
-            # Calculate overall collision risk
-            avg_risk = np.mean([r['collision_risk'] for r in collision_risks]) if collision_risks else 0.0
-            max_risk = np.max([r['collision_risk'] for r in collision_risks]) if collision_risks else 0.0
-            
-            return {
-                'avg_collision_risk': avg_risk,
-                'max_collision_risk': max_risk,
-                'high_risk_objects': len([r for r in collision_risks if r['collision_risk'] > 0.5]),
-                'risk_level': 'low' if avg_risk < 0.2 else 'medium' if avg_risk < 0.5 else 'high'
-            }
-        except Exception as e:
-            logger.error(f"Error assessing collision risk: {e}")
-            return {}
+        return self._compute_all_metrics(scene_id)['collision_risk']
 
     def analyze_traffic_compliance(self, scene_id: Union[int, str]) -> Dict[str, Any]:
         """
@@ -395,40 +487,7 @@ class VehicleStateAnalyzer:
         Returns:
             Dictionary containing traffic compliance analysis
         """
-        try:
-            movement_data = self.data_loader.extract_ego_movement_data(scene_id)
-            if not movement_data:
-                return {}
-            
-            speeds = [entry['speed'] for entry in movement_data['movement_data'] if entry['speed'] > 0]
-            
-            # Define traffic rule thresholds (example values)
-            speed_limit = 8.0  # m/s (about 29 km/h)
-            max_accel_limit = 3.0  # m/s²
-            
-            # Check speed compliance
-            speed_violations = [s for s in speeds if s > speed_limit]
-            speed_compliance_rate = 1 - (len(speed_violations) / len(speeds)) if speeds else 1.0
-            
-            # Check acceleration compliance
-            accelerations = [np.linalg.norm(entry['acceleration']) for entry in movement_data['movement_data'] if any(entry['acceleration'])]
-            accel_violations = [a for a in accelerations if a > max_accel_limit]
-            accel_compliance_rate = 1 - (len(accel_violations) / len(accelerations)) if accelerations else 1.0
-            
-            # Overall compliance score
-            compliance_score = (speed_compliance_rate + accel_compliance_rate) / 2
-            
-            return {
-                'compliance_score': compliance_score,
-                'speed_compliance_rate': speed_compliance_rate,
-                'acceleration_compliance_rate': accel_compliance_rate,
-                'speed_violations': len(speed_violations),
-                'acceleration_violations': len(accel_violations),
-                'compliance_level': 'good' if compliance_score > 0.8 else 'moderate' if compliance_score > 0.6 else 'poor'
-            }
-        except Exception as e:
-            logger.error(f"Error analyzing traffic compliance: {e}")
-            return {}
+        return self._compute_all_metrics(scene_id)['traffic_compliance']
 
     def detect_system_performance_issues(self, scene_id: Union[int, str]) -> Dict[str, Any]:
         """
@@ -440,57 +499,232 @@ class VehicleStateAnalyzer:
         Returns:
             Dictionary containing system performance analysis
         """
-        try:
-            scene_data = self.data_loader.load_scene_data(scene_id)
-            samples = scene_data['samples']
-            
-            issues = []
-            
-            # Check for missing or inconsistent data
-            for sample_token, sample_data in samples.items():
-                ego_pose = sample_data['ego_pose']
-                
-                # Check for missing pose data
-                if not ego_pose.get('translation') or not ego_pose.get('rotation'):
-                    issues.append({
-                        'type': 'missing_pose_data',
-                        'timestamp': ego_pose.get('timestamp'),
-                        'severity': 'high'
-                    })
-                
-                # Check for sensor data issues
-                sensor_data = sample_data.get('sensor_data', {})
-                expected_sensors = ['CAM_FRONT', 'LIDAR_TOP']
-                
-                for sensor in expected_sensors:
-                    if sensor not in sensor_data:
-                        issues.append({
-                            'type': 'missing_sensor_data',
-                            'sensor': sensor,
-                            'timestamp': ego_pose.get('timestamp'),
-                            'severity': 'medium'
-                        })
-                
-                # Check for annotation consistency
-                annotations = sample_data.get('annotations', [])
-                if len(annotations) == 0:
-                    issues.append({
-                        'type': 'no_annotations',
-                        'timestamp': ego_pose.get('timestamp'),
-                        'severity': 'medium'
-                    })
-            
-            return {
-                'total_issues': len(issues),
-                'high_severity_issues': len([i for i in issues if i['severity'] == 'high']),
-                'medium_severity_issues': len([i for i in issues if i['severity'] == 'medium']),
-                'issues': issues,
-                'system_health': 'good' if len(issues) == 0 else 'moderate' if len(issues) < 5 else 'poor'
+        return self._compute_all_metrics(scene_id)['system_performance']
+
+    def _velocity_summary(self, movement: Dict[str, Any], profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the velocity summary from the shared movement profile"""
+        # Extract velocity-related metrics
+        avg_speed, min_speed, max_speed, speed_std = profile['speed_stats']
+        avg_accel, _, max_accel, _ = profile['acceleration_stats']
+        summary_stats = movement['summary_stats']
+        
+        return {
+            'avg_speed': avg_speed,
+            'max_speed': max_speed,
+            'min_speed': min_speed,
+            'speed_std': speed_std,
+            'avg_acceleration': avg_accel,
+            'max_acceleration': max_accel,
+            'total_distance': summary_stats['total_distance'],
+            'total_duration': summary_stats['total_duration'],
+            'movement_segments': {
+                'turning': len(summary_stats['turning_segments']),
+                'straight': len(summary_stats['straight_segments']),
+                'stopping': len(summary_stats['stopping_periods'])
             }
-        except Exception as e:
-            logger.error(f"Error detecting system performance issues: {e}")
-            return {}
+        }
+
+    def _driving_style(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the driving style classification from the shared movement profile"""
+        # Calculate style indicators
+        avg_speed, _, max_speed, _ = profile['speed_stats']
+        avg_accel, _, max_accel, _ = profile['acceleration_stats']
+        avg_curvature, _, _, _ = profile['curvature_stats']
+        
+        # Calculate style score (0 = conservative, 1 = aggressive)
+        speed_score = min(avg_speed / self._SPEED_THRESH, 1.0)
+        accel_score = min(avg_accel / self._ACCEL_THRESH, 1.0)
+        curvature_score = min(avg_curvature / self._CURVATURE_THRESH, 1.0)
+        
+        overall_score = (speed_score + accel_score + curvature_score) / 3
+        
+        # Classify style
+        if overall_score < 0.3:
+            style = "conservative"
+        elif overall_score < 0.7:
+            style = "moderate"
+        else:
+            style = "aggressive"
+        
+        return {
+            'style': style,
+            'overall_score': overall_score,
+            'speed_score': speed_score,
+            'acceleration_score': accel_score,
+            'curvature_score': curvature_score,
+            'metrics': {
+                'avg_speed': avg_speed,
+                'max_speed': max_speed,
+                'avg_acceleration': avg_accel,
+                'max_acceleration': max_accel,
+                'avg_curvature': avg_curvature
+            }
+        }
+
+    def _smoothness(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the smoothness analysis from the fused scene statistics"""
+        avg_jerk = stats['avg_jerk']
+        max_jerk = stats['max_jerk']
+        avg_angular_accel = stats['avg_angular_acceleration']
+        max_angular_accel = stats['max_angular_acceleration']
+        
+        # Smoothness score (lower is smoother)
+        jerk_score = min(avg_jerk / 5.0, 1.0)  # Normalize to 0-1
+        angular_score = min(avg_angular_accel / 2.0, 1.0)
+        smoothness_score = 1.0 - (jerk_score + angular_score) / 2
+        
+        return {
+            'smoothness_score': smoothness_score,
+            'avg_jerk': avg_jerk,
+            'max_jerk': max_jerk,
+            'avg_angular_acceleration': avg_angular_accel,
+            'max_angular_acceleration': max_angular_accel,
+            'smoothness_level': 'smooth' if smoothness_score > 0.7 else 'moderate' if smoothness_score > 0.4 else 'rough'
+        }
+
+    def _predictability(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the predictability analysis from the shared movement profile"""
+        # Calculate consistency metrics
+        _, _, _, speed_std = profile['speed_stats']
+        _, _, _, accel_std = profile['acceleration_stats']
+        _, _, _, curvature_std = profile['curvature_stats']
+        
+        # Normalize standard deviations
+        speed_consistency = max(0, 1 - (speed_std / 3.0))  # Lower std = higher consistency
+        accel_consistency = max(0, 1 - (accel_std / 2.0))
+        curvature_consistency = max(0, 1 - (curvature_std / 0.01))
+        
+        # Overall predictability score
+        predictability_score = (speed_consistency + accel_consistency + curvature_consistency) / 3
+        
+        return {
+            'predictability_score': predictability_score,
+            'speed_consistency': speed_consistency,
+            'acceleration_consistency': accel_consistency,
+            'curvature_consistency': curvature_consistency,
+            'predictability_level': 'predictable' if predictability_score > 0.7 else 'moderate' if predictability_score > 0.4 else 'unpredictable'
+        }
+
+    def _risk_score(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the risk assessment from the fused scene statistics"""
+        # Risk factors
+        max_speed = stats['max_speed']
+        max_accel = stats['max_acceleration']
+        max_jerk = stats['max_jerk']
+        
+        # Risk thresholds
+        speed_risk = min(max_speed / 10.0, 1.0)  # 10 m/s threshold
+        accel_risk = min(max_accel / 5.0, 1.0)   # 5 m/s² threshold
+        jerk_risk = min(max_jerk / 10.0, 1.0)    # 10 m/s³ threshold
+        
+        # Overall risk score
+        risk_score = (speed_risk + accel_risk + jerk_risk) / 3
+        
+        return {
+            'risk_score': risk_score,
+            'speed_risk': speed_risk,
+            'acceleration_risk': accel_risk,
+            'jerk_risk': jerk_risk,
+            'risk_level': 'low' if risk_score < 0.3 else 'medium' if risk_score < 0.7 else 'high',
+            'max_speed': max_speed,
+            'max_acceleration': max_accel,
+            'max_jerk': max_jerk
+        }
+
+    def _safety_margins(self, proximity: Tuple) -> Dict[str, Any]:
+        """Build the safety margin analysis from the scene's _scan_distances result"""
+        # Close (5 m) and high-risk (2 m) interaction counts and distance statistics
+        close_interactions, high_risk_interactions, avg_distance, min_distance = proximity[:4]
+        
+        return {
+            'avg_safety_margin': avg_distance,
+            'min_safety_margin': min_distance,
+            'close_interactions': close_interactions,
+            'high_risk_interactions': high_risk_interactions,
+            'safety_score': max(0, 1 - (close_interactions / 10))  # Fewer interactions = higher safety
+        }
+
+    def _collision_risk(self, proximity: Tuple) -> Dict[str, Any]:
+        """Build the collision risk assessment from the scene's _scan_distances result"""
+        # Simple collision risk based on distance only
+        # In a real implementation, you'd calculate relative velocity
+        avg_risk, max_risk, high_risk_objects = proximity[4:]
+        
+        return {
+            'avg_collision_risk': avg_risk,
+            'max_collision_risk': max_risk,
+            'high_risk_objects': high_risk_objects,
+            'risk_level': 'low' if avg_risk < 0.2 else 'medium' if avg_risk < 0.5 else 'high'
+        }
+
+    def _traffic_compliance(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the traffic compliance analysis from the fused scene statistics"""
+        # Check speed compliance
+        speed_violations = stats['speed_violations']
+        moving_samples = stats['moving_samples']
+        speed_compliance_rate = 1 - (speed_violations / moving_samples) if moving_samples else 1.0
+        
+        # Check acceleration compliance
+        accel_violations = stats['acceleration_violations']
+        accelerating_samples = stats['accelerating_samples']
+        accel_compliance_rate = 1 - (accel_violations / accelerating_samples) if accelerating_samples else 1.0
+        
+        # Overall compliance score
+        compliance_score = (speed_compliance_rate + accel_compliance_rate) / 2
+        
+        return {
+            'compliance_score': compliance_score,
+            'speed_compliance_rate': speed_compliance_rate,
+            'acceleration_compliance_rate': accel_compliance_rate,
+            'speed_violations': speed_violations,
+            'acceleration_violations': accel_violations,
+            'compliance_level': 'good' if compliance_score > 0.8 else 'moderate' if compliance_score > 0.6 else 'poor'
+        }
 
+    def _system_performance(self, samples: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the system performance analysis from the scene samples"""
+        issues = []
+        
+        # Check for missing or inconsistent data
+        for sample_token, sample_data in samples.items():
+            ego_pose = sample_data.get('ego_pose') or {}
+            
+            # Check for missing pose data
+            if not ego_pose.get('translation') or not ego_pose.get('rotation'):
+                issues.append({
+                    'type': 'missing_pose_data',
+                    'timestamp': ego_pose.get('timestamp'),
+                    'severity': 'high'
+                })
+            
+            # Check for sensor data issues
+            missing_sensors = self._EXPECTED_SENSORS.difference(sample_data.get('sensor_data', {}))
+            if missing_sensors:
+                timestamp = ego_pose.get('timestamp')
+                issues.extend({
+                    'type': 'missing_sensor_data',
+                    'sensor': sensor,
+                    'timestamp': timestamp,
+                    'severity': 'medium'
+                } for sensor in sorted(missing_sensors))
+            
+            # Check for annotation consistency
+            annotations = sample_data.get('annotations', [])
+            if len(annotations) == 0:
+                issues.append({
+                    'type': 'no_annotations',
+                    'timestamp': ego_pose.get('timestamp'),
+                    'severity': 'medium'
+                })
+        
+        severity_counts = Counter(issue['severity'] for issue in issues)
+        return {
+            'total_issues': len(issues),
+            'high_severity_issues': severity_counts['high'],
+            'medium_severity_issues': severity_counts['medium'],
+            'issues': issues,
+            'system_health': 'good' if len(issues) == 0 else 'moderate' if len(issues) < 5 else 'poor'
+        }
 
     def analyze_scene(self, scene_id: Union[int, str]) -> Dict[str, Any]:
         """
@@ -502,24 +736,25 @@ class VehicleStateAnalyzer:
         Returns:
             Dictionary containing comprehensive analysis
         """
-        try:
-            analysis = {
-                'scene_id': scene_id,
-                'velocity_summary': self.get_velocity_summary(scene_id),
-                'driving_style': self.classify_driving_style(scene_id),
-                'smoothness': self.analyze_smoothness(scene_id),
-                'predictability': self.analyze_predictability(scene_id),
-                'risk_assessment': self.calculate_risk_score(scene_id),
-                'safety_margins': self.analyze_safety_margins(scene_id),
-                'collision_risk': self.assess_collision_risk(scene_id),
-                'traffic_compliance': self.analyze_traffic_compliance(scene_id),
-                'system_performance': self.detect_system_performance_issues(scene_id)
-            }
-            
-            return analysis
-        except Exception as e:
-            logger.error(f"Error generating comprehensive analysis: {e}")
-            return {}
+        return {
+            'scene_id': scene_id,
+            **self._compute_all_metrics(scene_id)
+        }
+    
+    @staticmethod
+    def _push(summary_list: List[Dict[str, Any]], scene_name: str, source: Dict[str, Any],
+              fields: Tuple[Tuple[str, str, Any], ...]) -> None:
+        """
+        Append a scene summary row if the source analysis is available.
+        
+        Args:
+            summary_list: Summary list to append the row to
+            scene_name: Display name of the scene
+            source: Metric dictionary from the scene analysis
+            fields: (summary key, source key, default) triples to copy
+        """
+        if source:
+            summary_list.append({'scene': scene_name, **{key: source.get(source_key, default) for key, source_key, default in fields}})
     
     def analyze_all_scenes(self) -> Dict[str, Any]:
         """
@@ -539,59 +774,34 @@ class VehicleStateAnalyzer:
             'compliance_scores': []
         }
         
-        for scene_id in range(1, 7):
+        # Scenes are independent, so analyze them concurrently; results are read back in scene order
+        scene_ids = self.data_loader.list_scene_ids()
+        with ThreadPoolExecutor(max_workers=max(1, min(self._MAX_WORKERS, len(scene_ids)))) as executor:
+            futures = [executor.submit(self.analyze_scene, scene_id) for scene_id in scene_ids]
+        
+        for scene_id, future in zip(scene_ids, futures):
+            # Single error boundary: a failing scene is logged and left empty
             try:
-                scene_analysis = self.analyze_scene(scene_id)
-                all_scenes_analysis[f"Scene {scene_id}"] = scene_analysis
-                
-                # Collect summary data for overall analysis
-                if scene_analysis:
-                    # Driving style
-                    driving_style = scene_analysis.get('driving_style', {})
-                    if driving_style:
-                        scene_summaries['driving_styles'].append({
-                            'scene': f"Scene {scene_id}",
-                            'style': driving_style.get('style', 'unknown'),
-                            'score': driving_style.get('overall_score', 0)
-                        })
-                    
-                    # Speed data
-                    velocity_summary = scene_analysis.get('velocity_summary', {})
-                    if velocity_summary:
-                        scene_summaries['avg_speeds'].append({
-                            'scene': f"Scene {scene_id}",
-                            'avg_speed': velocity_summary.get('avg_speed', 0),
-                            'max_speed': velocity_summary.get('max_speed', 0)
-                        })
-                    
-                    # Risk assessment
-                    risk_assessment = scene_analysis.get('risk_assessment', {})
-                    if risk_assessment:
-                        scene_summaries['risk_scores'].append({
-                            'scene': f"Scene {scene_id}",
-                            'risk_score': risk_assessment.get('overall_risk_score', 0),
-                            'risk_level': risk_assessment.get('risk_level', 'unknown')
-                        })
-                    
-                    # Smoothness
-                    smoothness = scene_analysis.get('smoothness', {})
-                    if smoothness:
-                        scene_summaries['smoothness_scores'].append({
-                            'scene': f"Scene {scene_id}",
-                            'smoothness_score': smoothness.get('overall_smoothness_score', 0)
-                        })
-                    
-                    # Traffic compliance
-                    traffic_compliance = scene_analysis.get('traffic_compliance', {})
-                    if traffic_compliance:
-                        scene_summaries['compliance_scores'].append({
-                            'scene': f"Scene {scene_id}",
-                            'compliance_level': traffic_compliance.get('compliance_level', 'unknown')
-                        })
-                        
+                scene_analysis = future.result()
             except Exception as e:
                 logger.error(f"Error analyzing scene {scene_id}: {e}")
-                continue
+                scene_analysis = {}
+            
+            scene_name = f"Scene {scene_id}"
+            all_scenes_analysis[scene_name] = scene_analysis
+            
+            # Collect summary data for overall analysis
+            if scene_analysis:
+                self._push(scene_summaries['driving_styles'], scene_name, scene_analysis.get('driving_style'),
+                           (('style', 'style', 'unknown'), ('score', 'overall_score', 0)))
+                self._push(scene_summaries['avg_speeds'], scene_name, scene_analysis.get('velocity_summary'),
+                           (('avg_speed', 'avg_speed', 0), ('max_speed', 'max_speed', 0)))
+                self._push(scene_summaries['risk_scores'], scene_name, scene_analysis.get('risk_assessment'),
+                           (('risk_score', 'overall_risk_score', 0), ('risk_level', 'risk_level', 'unknown')))
+                self._push(scene_summaries['smoothness_scores'], scene_name, scene_analysis.get('smoothness'),
+                           (('smoothness_score', 'overall_smoothness_score', 0),))
+                self._push(scene_summaries['compliance_scores'], scene_name, scene_analysis.get('traffic_compliance'),
+                           (('compliance_level', 'compliance_level', 'unknown'),))
         
         return {
             'scene_analyses': all_scenes_analysis,
@@ -4,6 +4,8 @@ Constants for the parsers module.
 Token mappings and other constants used by data loading and parsing.
 """
 
+from types import MappingProxyType
+
 # Token mappings for scenes and keyframes
 SCENE_TOKEN_MAPPINGS = {
     1: "cc8c0bf57f984915a77078b10eb33198",  # scene-0061
@@ -65,4 +67,12 @@ KEYFRAME_TOKEN_MAPPINGS = {
         4: "b902d29df24c4efda414a9a88ed57031",
         5: "d7cb9aa06de1442d8e2a22d562045cb4"
     }
-} 
\ No newline at end of file
+}
+
+# Freeze the shared mappings so no caller can mutate them in place
+SCENE_TOKEN_MAPPINGS = MappingProxyType(SCENE_TOKEN_MAPPINGS)
+
+KEYFRAME_TOKEN_MAPPINGS = MappingProxyType({
+    scene_token: MappingProxyType(keyframe_mapping)
+    for scene_token, keyframe_mapping in KEYFRAME_TOKEN_MAPPINGS.items()
+})
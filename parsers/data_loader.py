@@ -4,7 +4,11 @@ Data Loader for concatenated Dataset
 Loads and parses concatenated JSON data for analysis with caching for performance.
 """
 
+import functools
+import hashlib
 import json
+import mmap
+import threading
 import numpy as np
 from typing import Dict, List, Any, Union, Optional
 from pathlib import Path
@@ -13,6 +17,13 @@ from loguru import logger
 # Import token mappings from local constants
 from .constants import SCENE_TOKEN_MAPPINGS, KEYFRAME_TOKEN_MAPPINGS
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # Parses memoryviews in place
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    def _json_loads(data):
+        return json.loads(bytes(data))
+
 
 class DataLoader:
     """Load and parse concatenated JSON data with caching"""
@@ -28,6 +39,7 @@ class DataLoader:
         self.data_path = self._assign_data_path(data_path)
         self._all_data_cache: Optional[Dict[str, Any]] = None
         self._scene_data_cache: Dict[str, Any] = {}
+        self._load_lock = threading.Lock()
         
         # Validate constants against actual data on startup (optional)
         if validate_on_startup:
@@ -49,6 +61,29 @@ class DataLoader:
             logger.error(f"Error assigning data path: {e}")
             return "data/concatenated_data/concatenated_data.json"
     
+    def cache_fingerprint(self, version: str = "") -> Optional[str]:
+        """
+        Fingerprint the data file for on-disk cache keys.
+        
+        Combines the file's resolved path, mtime and size with the version of the
+        code that derived the cached results, so a cache is invalidated when
+        either changes.
+        
+        Args:
+            version: Version string of the code producing the cached results
+            
+        Returns:
+            16-character hex digest, or None if the data file cannot be stat'ed
+        """
+        try:
+            source = Path(self.data_path)
+            stat = source.stat()
+            resolved = source.resolve()
+        except OSError:
+            return None
+        key = f"{resolved}:{stat.st_mtime_ns}:{stat.st_size}:{version}"
+        return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()[:16]
+    
     def _get_token_mappings(self) -> Dict[str, Dict[int, str]]:
         """
         Get token mappings for scenes and keyframes from constants.
@@ -61,6 +96,16 @@ class DataLoader:
             'keyframes': KEYFRAME_TOKEN_MAPPINGS
         }
     
+    def list_scene_ids(self) -> List[int]:
+        """
+        List the serial numbers of scenes available in the loaded data.
+        
+        Returns:
+            Sorted list of scene serial numbers whose tokens are present in the data
+        """
+        all_data = self.load_all_data()
+        return [scene_id for scene_id, scene_token in sorted(SCENE_TOKEN_MAPPINGS.items()) if scene_token in all_data]
+    
     def _assign_scene_token(self, scene_id) -> str:
         """
         Assign scene id to the scene token using cached mappings.
@@ -113,14 +158,23 @@ class DataLoader:
         Returns:
             Dictionary containing scene data with scene tokens as keys
         """
-        if self._all_data_cache is None:
-            try:
-                with open(self.data_path, 'r') as f:
-                    self._all_data_cache = json.load(f)
-                logger.info(f"Loaded data from {self.data_path}")
-            except Exception as e:
-                logger.error(f"Error loading data: {e}")
-                self._all_data_cache = {}
+        all_data = self._all_data_cache
+        if all_data is not None:
+            return all_data
+        
+        # Double-checked so concurrent scene workers parse the file only once
+        with self._load_lock:
+            if self._all_data_cache is None:
+                try:
+                    # Parse straight from a read-only memory map instead of copying the file into a bytes object
+                    with open(self.data_path, 'rb') as f, \
+                            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                            memoryview(mapped) as view:
+                        self._all_data_cache = _json_loads(view)
+                    logger.info(f"Loaded data from {self.data_path}")
+                except Exception as e:
+                    logger.error(f"Error loading data: {e}")
+                    self._all_data_cache = {}
         
         return self._all_data_cache
     
@@ -426,56 +480,41 @@ class DataLoader:
         if not movement_data:
             return {}
         
-        speeds = [entry['speed'] for entry in movement_data if entry['speed'] > 0]
-        curvatures = [entry['curvature'] for entry in movement_data if entry['curvature'] > 0]
+        count = len(movement_data)
+        speeds = np.fromiter((entry['speed'] for entry in movement_data), dtype=np.float64, count=count)
+        curvatures = np.fromiter((entry['curvature'] for entry in movement_data), dtype=np.float64, count=count)
         
         # Calculate total distance
-        total_distance = 0
-        for i in range(1, len(movement_data)):
-            pos_curr = np.array(movement_data[i]['position'])
-            pos_prev = np.array(movement_data[i-1]['position'])
-            total_distance += np.linalg.norm(pos_curr - pos_prev)
+        positions = np.array([entry['position'] for entry in movement_data], dtype=np.float64).reshape(count, -1)
+        total_distance = float(np.linalg.norm(np.diff(positions, axis=0), axis=1).sum())
         
-        # Identify movement segments
-        turning_segments = []
-        straight_segments = []
-        stopping_periods = []
-        
-        # Simple threshold-based segmentation
+        # Identify movement segments with simple threshold-based labels:
+        # 0 = turning, 1 = straight, 2 = stopping
         curvature_threshold = 0.01
         speed_threshold = 0.5  # m/s
-        
-        current_segment_start = 0
-        current_segment_type = None
-        
-        for i, entry in enumerate(movement_data):
-            if entry['curvature'] > curvature_threshold:
-                segment_type = 'turning'
-            elif entry['speed'] < speed_threshold:
-                segment_type = 'stopping'
-            else:
-                segment_type = 'straight'
-            
-            if segment_type != current_segment_type:
-                # End current segment
-                if current_segment_type == 'turning':
-                    turning_segments.append((current_segment_start, i-1))
-                elif current_segment_type == 'straight':
-                    straight_segments.append((current_segment_start, i-1))
-                elif current_segment_type == 'stopping':
-                    stopping_periods.append((current_segment_start, i-1))
-                
-                # Start new segment
-                current_segment_start = i
-                current_segment_type = segment_type
+        labels = np.where(curvatures > curvature_threshold, 0, np.where(speeds < speed_threshold, 2, 1))
+        
+        # A segment starts wherever the label changes; every segment but the
+        # still-open last one is closed at the sample before the next start
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(labels)) + 1))
+        closed_starts = starts[:-1]
+        closed_ends = starts[1:] - 1
+        closed_labels = labels[closed_starts]
+        turning_segments, straight_segments, stopping_periods = (
+            list(zip(closed_starts[closed_labels == label].tolist(), closed_ends[closed_labels == label].tolist()))
+            for label in range(3)
+        )
+        
+        speeds = speeds[speeds > 0]
+        curvatures = curvatures[curvatures > 0]
         
         return {
             'total_distance': total_distance,
-            'avg_speed': np.mean(speeds) if speeds else 0.0,
-            'max_speed': np.max(speeds) if speeds else 0.0,
-            'min_speed': np.min(speeds) if speeds else 0.0,
-            'avg_curvature': np.mean(curvatures) if curvatures else 0.0,
-            'max_curvature': np.max(curvatures) if curvatures else 0.0,
+            'avg_speed': np.mean(speeds) if speeds.size else 0.0,
+            'max_speed': np.max(speeds) if speeds.size else 0.0,
+            'min_speed': np.min(speeds) if speeds.size else 0.0,
+            'avg_curvature': np.mean(curvatures) if curvatures.size else 0.0,
+            'max_curvature': np.max(curvatures) if curvatures.size else 0.0,
             'turning_segments': turning_segments,
             'straight_segments': straight_segments,
             'stopping_periods': stopping_periods,
@@ -584,4 +623,26 @@ class DataLoader:
         except Exception as e:
             logger.error(f"Data integrity validation failed: {e}")
             return False
-    
\ No newline at end of file
+
+
+def get_loader(data_path: str = "data/concatenated_data/concatenated_data.json") -> DataLoader:
+    """
+    Get the shared DataLoader for a data file, creating it on first use.
+    
+    Callers that only read data should use this instead of constructing a
+    DataLoader, so the JSON file is parsed once per process. The path is
+    resolved first, so every spelling of the same file shares one loader.
+    
+    Args:
+        data_path: Path to the concatenated JSON data file
+        
+    Returns:
+        DataLoader instance shared by every caller with the same file
+    """
+    return _cached_loader(str(Path(data_path).resolve()))
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_loader(data_path: str) -> DataLoader:
+    """Create the DataLoader for an already resolved data path"""
+    return DataLoader(data_path)
@@ -1,4 +1,4 @@
-from parsers.data_loader import DataLoader
+from parsers.data_loader import get_loader
 from loguru import logger
 import cv2
 import matplotlib.pyplot as plt
@@ -10,7 +10,7 @@ from typing import Dict, List, Any
 
 class ContextRetriever:
     def __init__(self, scene_id, keyframe_id):
-        self.data_loader = DataLoader()
+        self.data_loader = get_loader()
         self.scene_id = scene_id
         self.keyframe_id = keyframe_id
         self.keyframe_token = self.data_loader._assign_keyframe_token(scene_id, keyframe_id)
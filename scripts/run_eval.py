@@ -24,7 +24,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from rag.rag_agent import RAGAgent
-from parsers.data_loader import DataLoader
+from parsers.data_loader import get_loader
 
 
 def setup_logging():
@@ -46,7 +46,7 @@ def validate_api_key() -> str:
 
 def get_evaluation_config() -> Dict[str, Any]:
     """Get the evaluation configuration with scenes, keyframes, and QA types"""
-    data_loader = DataLoader()
+    data_loader = get_loader()
     
     config = {
         'scenes': list(range(1, 7)),  # Scenes 1-6
@@ -68,7 +68,7 @@ def get_evaluation_config() -> Dict[str, Any]:
 def generate_evaluation_tasks(config: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Generate a list of evaluation tasks"""
     tasks = []
-    data_loader = DataLoader()
+    data_loader = get_loader()
     
     for scene_id in config['scenes']:
         max_keyframes = min(config['max_keyframes_per_scene'], 
@@ -4,9 +4,16 @@ Tests for Data Loader
 Tests the DriveLMDataLoader functionality.
 """
 
+import json
+import os
+import tempfile
 import unittest
+from pathlib import Path
 
-from parsers.data_loader import DataLoader
+import numpy as np
+
+from parsers.constants import SCENE_TOKEN_MAPPINGS, KEYFRAME_TOKEN_MAPPINGS
+from parsers.data_loader import DataLoader, get_loader, _cached_loader
 
 
 class TestDataLoader(unittest.TestCase):
@@ -41,5 +48,152 @@ class TestDataLoader(unittest.TestCase):
         pass
 
 
+
+def reference_segments(movement_data, curvature_threshold=0.01, speed_threshold=0.5):
+    """Segment labelling loop that _calculate_movement_summary replaced, kept as the reference"""
+    segments = {'turning': [], 'straight': [], 'stopping': []}
+    current_segment_start = 0
+    current_segment_type = None
+    
+    for i, entry in enumerate(movement_data):
+        if entry['curvature'] > curvature_threshold:
+            segment_type = 'turning'
+        elif entry['speed'] < speed_threshold:
+            segment_type = 'stopping'
+        else:
+            segment_type = 'straight'
+        
+        if segment_type != current_segment_type:
+            if current_segment_type is not None:
+                segments[current_segment_type].append((current_segment_start, i - 1))
+            current_segment_start = i
+            current_segment_type = segment_type
+    
+    return segments['turning'], segments['straight'], segments['stopping']
+
+
+def movement_entries(labels):
+    """Movement data whose samples fall in the given segments ('t' turning, 's' straight, 'p' stopping)"""
+    speed = {'t': 3.0, 's': 3.0, 'p': 0.1}
+    curvature = {'t': 0.02, 's': 0.0, 'p': 0.0}
+    return [
+        {
+            'timestamp': i * 500_000,
+            'position': [float(i), 0.0, 0.0],
+            'speed': speed[label],
+            'curvature': curvature[label]
+        }
+        for i, label in enumerate(labels)
+    ]
+
+
+class TestMovementSummary(unittest.TestCase):
+    """Test cases for DataLoader._calculate_movement_summary segmentation"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.loader = DataLoader(validate_on_startup=False)
+    
+    def assert_segments_match(self, movement_data):
+        """Compare the vectorized segments with the reference loop"""
+        summary = self.loader._calculate_movement_summary(movement_data)
+        turning, straight, stopping = reference_segments(movement_data)
+        self.assertEqual(summary['turning_segments'], turning)
+        self.assertEqual(summary['straight_segments'], straight)
+        self.assertEqual(summary['stopping_periods'], stopping)
+    
+    def test_empty(self):
+        """Test that empty movement data has no summary"""
+        self.assertEqual(self.loader._calculate_movement_summary([]), {})
+    
+    def test_single_sample(self):
+        """Test that a single sample is one open segment, so nothing is closed"""
+        for label in 'tsp':
+            with self.subTest(label=label):
+                self.assert_segments_match(movement_entries(label))
+    
+    def test_single_label_throughout(self):
+        """Test that one label for every sample never closes a segment"""
+        for label in 'tsp':
+            with self.subTest(label=label):
+                self.assert_segments_match(movement_entries(label * 10))
+    
+    def test_alternating_labels(self):
+        """Test that every sample starts a new segment when labels alternate"""
+        for labels in ('tstststs', 'tsptsptsp', 'psps'):
+            with self.subTest(labels=labels):
+                self.assert_segments_match(movement_entries(labels))
+    
+    def test_open_final_run(self):
+        """Test that a run still open at the last sample is not reported"""
+        summary = self.loader._calculate_movement_summary(movement_entries('sssttppp'))
+        self.assertEqual(summary['straight_segments'], [(0, 2)])
+        self.assertEqual(summary['turning_segments'], [(3, 4)])
+        self.assertEqual(summary['stopping_periods'], [])
+        self.assert_segments_match(movement_entries('sssttppp'))
+    
+    def test_random_labels(self):
+        """Test random label sequences against the reference loop"""
+        rng = np.random.default_rng(0)
+        for n in (2, 5, 50):
+            labels = ''.join(rng.choice(list('tsp'), n))
+            with self.subTest(labels=labels):
+                self.assert_segments_match(movement_entries(labels))
+
+
+
+def minimal_dataset():
+    """Smallest dataset that passes startup validation: every known scene and keyframe token, no samples"""
+    return {
+        scene_token: {
+            'scene_name': f"scene-{scene_id}",
+            'scene_description': '',
+            'samples': {},
+            'key_frames': {
+                keyframe_token: {'QA': {}, 'key_object_infos': {}}
+                for keyframe_token in KEYFRAME_TOKEN_MAPPINGS[scene_token].values()
+            }
+        }
+        for scene_id, scene_token in SCENE_TOKEN_MAPPINGS.items()
+    }
+
+
+class TestGetLoader(unittest.TestCase):
+    """Test cases for the shared get_loader factory"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        _cached_loader.cache_clear()
+        self.addCleanup(_cached_loader.cache_clear)
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_path = Path(tmp_dir.name)
+    
+    def write_dataset(self, name):
+        """Write the minimal dataset to a file in the temporary directory"""
+        data_path = self.tmp_path / name
+        data_path.write_text(json.dumps(minimal_dataset()))
+        return data_path
+    
+    def test_same_file_shares_one_loader(self):
+        """Test that absolute, relative and dotted spellings of one file return the same loader"""
+        data_path = self.write_dataset('data.json')
+        loader = get_loader(str(data_path))
+        
+        self.assertIs(get_loader(os.path.relpath(data_path)), loader)
+        self.assertIs(get_loader(str(self.tmp_path / '.' / 'data.json')), loader)
+        self.assertEqual(_cached_loader.cache_info().currsize, 1)
+    
+    def test_least_recently_used_loader_is_evicted(self):
+        """Test that a fifth data file evicts the least recently used loader"""
+        maxsize = _cached_loader.cache_info().maxsize
+        paths = [str(self.write_dataset(f"data_{i}.json")) for i in range(maxsize + 1)]
+        loaders = [get_loader(path) for path in paths]
+        
+        self.assertEqual(_cached_loader.cache_info().currsize, maxsize)
+        self.assertIs(get_loader(paths[-1]), loaders[-1])
+        self.assertIsNot(get_loader(paths[0]), loaders[0])
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
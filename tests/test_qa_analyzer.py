@@ -0,0 +1,81 @@
+"""
+Tests for QA Analyzer
+
+Tests keyframe-level QA analysis on synthetic data.
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from analysis.qa_analyzer import QAAnalyzer
+from parsers.constants import SCENE_TOKEN_MAPPINGS, KEYFRAME_TOKEN_MAPPINGS
+from parsers.data_loader import DataLoader
+
+
+def qa_pair(question, answer):
+    """Build one QA pair in the dataset's format"""
+    return {'Q': question, 'A': answer}
+
+
+def synthetic_scene():
+    """Scene 1 with QA on its first two keyframes and none on the rest"""
+    scene_token = SCENE_TOKEN_MAPPINGS[1]
+    keyframe_tokens = KEYFRAME_TOKEN_MAPPINGS[scene_token]
+    key_frames = {token: {'QA': {}, 'key_object_infos': {}} for token in keyframe_tokens.values()}
+    key_frames[keyframe_tokens[1]]['QA'] = {
+        'perception': [qa_pair("Is there a car ahead?", "Yes, one car."), qa_pair("Any pedestrians?", "No.")],
+        'planning': [qa_pair("Should the ego vehicle turn left?", "No, keep going straight.")]
+    }
+    key_frames[keyframe_tokens[2]]['QA'] = {
+        'behavior': [qa_pair("What is the ego vehicle doing?", "Braking for a stop sign.")]
+    }
+    return {
+        'scene_name': 'scene-test',
+        'scene_description': 'synthetic',
+        'nbr_samples': 0,
+        'scene_token': scene_token,
+        'samples': {},
+        'key_frames': key_frames
+    }
+
+
+class TestAnalyzeKeyframe(unittest.TestCase):
+    """Test cases for QAAnalyzer.analyze_keyframe"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        data_path = Path(tmp_dir.name) / 'data.json'
+        data_path.write_text(json.dumps({SCENE_TOKEN_MAPPINGS[1]: synthetic_scene()}))
+        self.analyzer = QAAnalyzer(DataLoader(str(data_path), validate_on_startup=False))
+    
+    def test_keyframe_distribution(self):
+        """Test that a keyframe id counts only that keyframe's QA pairs"""
+        analysis = self.analyzer.analyze_keyframe(1, 1)
+        
+        self.assertEqual(
+            analysis['qa_type_distribution'],
+            {'total': 3, 'perception': 2, 'planning': 1, 'prediction': 0, 'behavior': 0}
+        )
+        self.assertEqual(self.analyzer.analyze_keyframe(1, 2)['qa_type_distribution']['total'], 1)
+    
+    def test_keyframe_zero_does_not_fall_back_to_scene(self):
+        """Test that falsy keyframe ids are rejected instead of analyzed as the whole scene"""
+        for keyframe_id in (0, None, ''):
+            with self.subTest(keyframe_id=keyframe_id):
+                with self.assertRaises(ValueError):
+                    self.analyzer.analyze_keyframe(1, keyframe_id)
+    
+    def test_scene_wide_distribution(self):
+        """Test that the scene-wide distribution is only selected with an explicit None"""
+        self.assertEqual(
+            self.analyzer._get_qa_distribution(1, None),
+            {'total': 4, 'perception': 2, 'planning': 1, 'prediction': 0, 'behavior': 1}
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+"""
+Tests for Vehicle State Analyzer
+
+Tests the numeric kernels against plain numpy references and the scene metrics
+on synthetic data.
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from analysis.vehicle_state_analyzer import VehicleStateAnalyzer, _scan_movement, _basic_stats, _scan_distances
+from parsers.constants import SCENE_TOKEN_MAPPINGS
+from parsers.data_loader import DataLoader
+
+
+def kernel_variants(kernel):
+    """Yield the compiled kernel and the plain Python function numba wraps, or just the function without numba"""
+    yield 'compiled', kernel
+    if hasattr(kernel, 'py_func'):
+        yield 'python', kernel.py_func
+
+
+def reference_scan_movement(speeds, accelerations, timestamps, angular_velocities, speed_limit, accel_limit):
+    """Numpy reference for _scan_movement"""
+    moving = speeds[speeds > 0]
+    magnitudes = np.linalg.norm(accelerations, axis=1)[np.any(accelerations != 0, axis=1)]
+    
+    jerks = []
+    angulars = []
+    for i in range(2, len(speeds)):
+        dt = (timestamps[i] - timestamps[i - 1]) / 1e6
+        if dt > 0:
+            jerks.append(np.linalg.norm(accelerations[i] - accelerations[i - 1]) / dt)
+            angulars.append(abs(angular_velocities[i] - angular_velocities[i - 1]) / dt)
+        else:
+            angulars.append(0.0)
+    
+    return (
+        moving.max() if moving.size else 0.0,
+        magnitudes.max() if magnitudes.size else 0.0,
+        np.mean(jerks) if jerks else 0.0,
+        max(jerks, default=0.0),
+        np.mean(angulars) if angulars else 0.0,
+        max(angulars, default=0.0),
+        moving.size,
+        magnitudes.size,
+        np.count_nonzero(moving > speed_limit),
+        np.count_nonzero(magnitudes > accel_limit)
+    )
+
+
+def reference_basic_stats(values):
+    """Numpy reference for _basic_stats"""
+    if values.size == 0:
+        return 0.0, 0.0, 0.0, 0.0
+    return np.mean(values), np.min(values), np.max(values), np.std(values)
+
+
+def reference_scan_distances(distances, close_distance, high_risk_distance, risk_range):
+    """Numpy reference for _scan_distances"""
+    if distances.size == 0:
+        return 0, 0, 0.0, 0.0, 0.0, 0.0, 0
+    risks = np.maximum(1 - distances / risk_range, 0.0)
+    return (
+        np.count_nonzero(distances < close_distance),
+        np.count_nonzero(distances < high_risk_distance),
+        np.mean(distances),
+        np.min(distances),
+        np.mean(risks),
+        np.max(risks),
+        np.count_nonzero(risks > 0.5)
+    )
+
+
+class TestKernels(unittest.TestCase):
+    """Test cases for the numba kernels in vehicle_state_analyzer"""
+    
+    SIZES = (0, 1, 2, 3, 17, 200)
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.rng = np.random.default_rng(0)
+    
+    def assert_matches(self, actual, expected):
+        """Compare kernel and reference tuples element by element"""
+        self.assertEqual(len(actual), len(expected))
+        for got, want in zip(actual, expected):
+            np.testing.assert_allclose(got, want, rtol=1e-9, atol=1e-12)
+    
+    def movement_arrays(self, n):
+        """Random movement arrays with stopped samples, zero accelerations and repeated timestamps"""
+        speeds = self.rng.uniform(0.0, 12.0, n)
+        speeds[self.rng.random(n) < 0.2] = 0.0
+        accelerations = self.rng.normal(0.0, 2.0, (n, 3))
+        accelerations[self.rng.random(n) < 0.2] = 0.0
+        steps = self.rng.integers(0, 500_000, n)
+        steps[self.rng.random(n) < 0.1] = 0
+        timestamps = np.cumsum(steps).astype(np.int64)
+        angular_velocities = self.rng.normal(0.0, 0.5, n)
+        return speeds, accelerations, timestamps, angular_velocities
+    
+    def test_scan_movement(self):
+        """Test _scan_movement against the numpy reference"""
+        for n in self.SIZES:
+            args = (*self.movement_arrays(n), 8.0, 3.0)
+            expected = reference_scan_movement(*args)
+            for name, kernel in kernel_variants(_scan_movement):
+                with self.subTest(n=n, kernel=name):
+                    self.assert_matches(kernel(*args), expected)
+    
+    def test_basic_stats(self):
+        """Test _basic_stats against the numpy reference"""
+        for n in self.SIZES:
+            values = self.rng.normal(3.0, 2.0, n)
+            expected = reference_basic_stats(values)
+            for name, kernel in kernel_variants(_basic_stats):
+                with self.subTest(n=n, kernel=name):
+                    self.assert_matches(kernel(values), expected)
+    
+    def test_scan_distances(self):
+        """Test _scan_distances against the numpy reference"""
+        for n in self.SIZES:
+            args = (self.rng.uniform(0.0, 30.0, n), 5.0, 2.0, 10.0)
+            expected = reference_scan_distances(*args)
+            for name, kernel in kernel_variants(_scan_distances):
+                with self.subTest(n=n, kernel=name):
+                    self.assert_matches(kernel(*args), expected)
+
+
+def synthetic_scene(bad_pose_index=None):
+    """Three-sample scene with one annotation per sample, optionally with an empty ego translation"""
+    samples = {}
+    for i in range(3):
+        timestamp = 1_500_000_000_000_000 + i * 500_000
+        samples[f"sample_{i}"] = {
+            'timestamp': timestamp,
+            'sensor_data': {'CAM_FRONT': {}, 'LIDAR_TOP': {}},
+            'annotations': [{'category': 'vehicle.car', 'translation': [float(i) + 3.0, 1.0, 0.0], 'size': [1.8, 4.5, 1.6]}],
+            'ego_pose': {
+                'timestamp': timestamp,
+                'translation': [] if i == bad_pose_index else [float(i), 0.0, 0.0],
+                'rotation': [1.0, 0.0, 0.0, 0.0]
+            }
+        }
+    return {
+        'scene_name': 'scene-test',
+        'scene_description': 'synthetic',
+        'nbr_samples': len(samples),
+        'scene_token': SCENE_TOKEN_MAPPINGS[1],
+        'samples': samples,
+        'key_frames': {}
+    }
+
+
+class TestSceneMetrics(unittest.TestCase):
+    """Test cases for VehicleStateAnalyzer scene metrics on synthetic data"""
+    
+    def make_analyzer(self, scene, extra_scenes=None):
+        """Write the scene (as scene 1, plus any extra scenes by token) to a temporary data file and build an analyzer over it"""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        data_path = Path(tmp_dir.name) / 'data.json'
+        data_path.write_text(json.dumps({SCENE_TOKEN_MAPPINGS[1]: scene, **(extra_scenes or {})}))
+        return VehicleStateAnalyzer(DataLoader(str(data_path), validate_on_startup=False))
+    
+    def test_clean_scene(self):
+        """Test that a well-formed scene gets proximity metrics and no issues"""
+        analysis = self.make_analyzer(synthetic_scene()).analyze_scene(1)
+        
+        self.assertEqual(analysis['safety_margins']['close_interactions'], 3)
+        self.assertAlmostEqual(analysis['safety_margins']['avg_safety_margin'], np.sqrt(10.0))
+        self.assertEqual(analysis['collision_risk']['high_risk_objects'], 3)
+        self.assertEqual(analysis['system_performance']['total_issues'], 0)
+    
+    def test_malformed_pose_still_reports_system_performance(self):
+        """Test that an empty ego translation empties only the proximity metrics"""
+        analysis = self.make_analyzer(synthetic_scene(bad_pose_index=1)).analyze_scene(1)
+        
+        self.assertEqual(analysis['safety_margins'], {})
+        self.assertEqual(analysis['collision_risk'], {})
+        performance = analysis['system_performance']
+        self.assertEqual(performance['total_issues'], 1)
+        self.assertEqual(performance['high_severity_issues'], 1)
+        self.assertEqual(performance['issues'][0]['type'], 'missing_pose_data')
+    
+    def test_failing_scene_is_isolated(self):
+        """Test that analyze_all_scenes leaves a failing scene empty and still analyzes the others"""
+        broken_scene = {key: value for key, value in synthetic_scene().items() if key != 'samples'}
+        analyses = self.make_analyzer(synthetic_scene(), {SCENE_TOKEN_MAPPINGS[2]: broken_scene}).analyze_all_scenes()
+        
+        self.assertEqual(analyses['scene_analyses']['Scene 2'], {})
+        self.assertEqual(analyses['scene_analyses']['Scene 1']['system_performance']['total_issues'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()